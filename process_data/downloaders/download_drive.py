@@ -1,12 +1,17 @@
 import os
 import re
+import contextlib
 import sys
 import json
 import time
+import atexit
 import argparse
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 try:
     from logging_config import get_logger
     from validation import validate_google_drive_url, validate_file_path, ValidationError
@@ -38,22 +43,75 @@ logger = get_logger(__name__)
 # Directory to save downloaded files (from config)
 DOWNLOADS_DIR = get_drive_downloads_dir()
 
+# Files from one Drive folder downloaded at once (overlaps network waits, stays polite to Drive)
+FOLDER_DOWNLOAD_WORKERS = 4
+
+# Pooled download sessions - keep TCP/TLS connections to Google alive across files.
+# requests.Session isn't thread-safe, so each concurrent download checks out its own
+_idle_sessions = []
+_sessions = []
+_sessions_lock = threading.Lock()
+
+@contextlib.contextmanager
+def download_session():
+    """Check out a pooled requests.Session for one file's download
+    
+    Cookies are cleared on checkout so Drive confirm/virus-scan cookies never
+    carry over to an unrelated file.
+    """
+    with _sessions_lock:
+        session = _idle_sessions.pop() if _idle_sessions else None
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        with _sessions_lock:
+            _sessions.append(session)
+    session.cookies.clear()
+    try:
+        yield session
+    finally:
+        with _sessions_lock:
+            _idle_sessions.append(session)
+
+def close_download_session():
+    """Close every pooled download session and release their connections"""
+    with _sessions_lock:
+        for session in _sessions:
+            session.close()
+        _sessions.clear()
+        _idle_sessions.clear()
+
+atexit.register(close_download_session)
+
+# Compiled once at import - these run for every URL/row processed
+FILE_ID_PATTERNS = (
+    re.compile(r'/file/d/([a-zA-Z0-9_-]+)'),  # /file/d/{fileId}
+    re.compile(r'id=([a-zA-Z0-9_-]+)'),       # id={fileId}
+    re.compile(r'drive.google.com/open\?id=([a-zA-Z0-9_-]+)'),  # open?id={fileId}
+)
+FOLDER_ID_PATTERNS = (
+    re.compile(r'/drive/folders/([a-zA-Z0-9_-]+)'),  # /drive/folders/{folderId}
+    re.compile(r'folders/([a-zA-Z0-9_-]+)'),         # folders/{folderId}
+)
+FOLDER_PAGE_FILE_ID_PATTERNS = (
+    re.compile(r'/file/d/([a-zA-Z0-9_-]+)'),   # /file/d/{fileId}
+    re.compile(r'data-id="([a-zA-Z0-9_-]+)"'),  # data-id="{fileId}"
+)
+VALID_DRIVE_ID = re.compile(r'^[a-zA-Z0-9_-]+$')
+CONTENT_DISPOSITION_FILENAME = re.compile(r'filename="?([^";]+)"?')
+
 def extract_file_id(url):
     """Extract Google Drive file ID from URL"""
     # Pattern for different Google Drive URL formats
-    patterns = [
-        r'/file/d/([a-zA-Z0-9_-]+)',  # /file/d/{fileId}
-        r'id=([a-zA-Z0-9_-]+)',       # id={fileId}
-        r'drive.google.com/open\?id=([a-zA-Z0-9_-]+)' # open?id={fileId}
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in FILE_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     
     # Try parsing the URL query parameters
-    parsed_url = urlparse(url)
+    parsed_url = urlsplit(url)
     query_params = parse_qs(parsed_url.query)
     
     # Check various possible parameter names
@@ -67,19 +125,33 @@ def extract_file_id(url):
 def extract_folder_id(url):
     """Extract Google Drive folder ID from URL"""
     # Pattern for folder URLs
-    folder_patterns = [
-        r'/drive/folders/([a-zA-Z0-9_-]+)',  # /drive/folders/{folderId}
-        r'folders/([a-zA-Z0-9_-]+)',         # folders/{folderId}
-    ]
-    
-    for pattern in folder_patterns:
-        match = re.search(pattern, url)
+    for pattern in FOLDER_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     
     return None
 
 
+# Signs that a folder page actually lists files
+FOLDER_CONTENT_INDICATORS = (
+    'drive.google.com/file/d/',
+    'data-id=',
+    '/file/d/',
+)
+
+# Error/login page indicators (pre-lowercased for case-insensitive matching)
+FOLDER_ERROR_INDICATORS = tuple(indicator.lower() for indicator in (
+    'Sign in - Google Accounts',
+    'access denied',
+    'permission denied',
+    'folder is empty',
+    'no files',
+    'Error 404',
+    'Error 403',
+))
+
+
 def _validate_folder_response(response, logger=None):
     """
     Validate that HTTP response contains folder data, not HTML/JavaScript.
@@ -99,8 +171,10 @@ def _validate_folder_response(response, logger=None):
     if not logger:
         logger = globals()['logger']  # Use module-level logger
     
+    html_content = response.text
+    
     # Check response size - allow larger responses for legitimate folders
-    content_length = len(response.text)
+    content_length = len(html_content)
     if content_length > 1000000:  # 1MB limit - only reject extremely large responses
         error_msg = f"Response too large ({content_length} bytes) - likely corrupted or malicious"
         logger.warning(sanitize_error_message(error_msg))
@@ -113,30 +187,13 @@ def _validate_folder_response(response, logger=None):
         logger.warning(sanitize_error_message(error_msg))
         return False, error_msg
     
-    html_content = response.text
-    
     # Check for legitimate folder content vs error pages
     # Look for signs this is actually a folder page with files
-    folder_content_indicators = [
-        'drive.google.com/file/d/',
-        'data-id=',
-        '/file/d/',
-    ]
-    
-    has_file_content = any(indicator in html_content for indicator in folder_content_indicators)
-    
-    # Check for error/login page indicators
-    error_indicators = [
-        'Sign in - Google Accounts',
-        'access denied',
-        'permission denied',
-        'folder is empty',
-        'no files',
-        'Error 404',
-        'Error 403',
-    ]
-    
-    has_error_content = any(indicator.lower() in html_content.lower() for indicator in error_indicators)
+    has_file_content = any(indicator in html_content for indicator in FOLDER_CONTENT_INDICATORS)
+    
+    # Check for error/login page indicators (lowercase the page once, not once per indicator)
+    html_lower = html_content.lower()
+    has_error_content = any(indicator in html_lower for indicator in FOLDER_ERROR_INDICATORS)
     
     if has_error_content and not has_file_content:
         error_msg = "Response appears to be an error or login page - folder likely private or inaccessible"
@@ -208,17 +265,9 @@ def list_folder_files(folder_url, logger=None):
         
         # Look for file patterns in the HTML
         # Google Drive embeds file information in JSON-like structures
-        import re
-        
-        # Extract file IDs using simpler, more reliable patterns
-        file_id_patterns = [
-            r'/file/d/([a-zA-Z0-9_-]+)',  # /file/d/{fileId}
-            r'data-id="([a-zA-Z0-9_-]+)"',  # data-id="{fileId}"
-        ]
-        
         found_file_ids = set()
-        for pattern in file_id_patterns:
-            matches = re.findall(pattern, html_content)
+        for pattern in FOLDER_PAGE_FILE_ID_PATTERNS:
+            matches = pattern.findall(html_content)
             for file_id in matches:
                 # Filter out invalid IDs (too short, system IDs, etc.)
                 if len(file_id) > 10 and file_id not in ['_gd', '_folder']:
@@ -300,25 +349,31 @@ def download_folder_files(folder_url, row_context, logger=None):
         
         logger.info(f"Found {len(folder_files)} files to download from folder")
         
-        # Download each file
-        for file_info in folder_files:
-            try:
+        # Download files concurrently; results are collected in folder order
+        with ThreadPoolExecutor(max_workers=min(FOLDER_DOWNLOAD_WORKERS, len(folder_files))) as executor:
+            futures = []
+            for file_info in folder_files:
                 logger.info(f"Downloading file: {file_info['name']} (ID: {file_info['id']})")
-                
                 # Download individual file (avoid recursion by calling internal function)
-                result = _download_individual_file_with_context(file_info['url'], row_context, logger)
-                
-                if result.success:
-                    downloaded_files.extend(result.files_downloaded)
-                    if result.metadata_file:
-                        metadata_files.append(result.metadata_file)
-                else:
-                    errors.append(f"Failed to download {file_info['name']}: {result.error_message}")
+                futures.append(executor.submit(
+                    _download_individual_file_with_context, file_info['url'], row_context, logger
+                ))
+            
+            for file_info, future in zip(folder_files, futures):
+                try:
+                    result = future.result()
                     
-            except Exception as e:
-                error_msg = f"Error downloading {file_info['name']}: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+                    if result.success:
+                        downloaded_files.extend(result.files_downloaded)
+                        if result.metadata_file:
+                            metadata_files.append(result.metadata_file)
+                    else:
+                        errors.append(f"Failed to download {file_info['name']}: {result.error_message}")
+                        
+                except Exception as e:
+                    error_msg = f"Error downloading {file_info['name']}: {str(e)}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
         
         # Create combined metadata for the folder download
         folder_id = extract_folder_id(folder_url)
@@ -358,7 +413,7 @@ def download_folder_files(folder_url, row_context, logger=None):
             
             try:
                 with open(metadata_path, 'w') as f:
-                    json.dump(folder_metadata, f, indent=2)
+                    f.write(json.dumps(folder_metadata, indent=2))
                 logger.info(f"Saved folder metadata to {combined_metadata_filename}")
             except Exception as e:
                 logger.warning(f"Could not save folder metadata: {e}")
@@ -392,42 +447,41 @@ def get_filename_from_url(url):
     
     return None
 
+# Map common MIME types to file extensions (built once, used by get_filename_from_response)
+MIME_TO_EXT = {
+    'application/pdf': '.pdf',
+    'application/msword': '.doc',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
+    'application/vnd.ms-excel': '.xls',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': '.xlsx',
+    'application/vnd.ms-powerpoint': '.ppt',
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': '.pptx',
+    'text/plain': '.txt',
+    'text/csv': '.csv',
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'application/zip': '.zip',
+    'application/x-rar-compressed': '.rar',
+    'application/x-tar': '.tar',
+    'application/x-gzip': '.gz',
+    'audio/mpeg': '.mp3',
+    'video/mp4': '.mp4',
+    'application/json': '.json'
+}
+
 def get_filename_from_response(response):
     """Extract filename from Content-Disposition header or content-type"""
     # Try Content-Disposition header first
     if 'Content-Disposition' in response.headers:
         content_disposition = response.headers['Content-Disposition']
-        match = re.search(r'filename="?([^";]+)"?', content_disposition)
+        match = CONTENT_DISPOSITION_FILENAME.search(content_disposition)
         if match:
             return match.group(1)
     
     # If no filename found, use the file ID with appropriate extension
     content_type = response.headers.get('Content-Type', '')
-    
-    # Map common MIME types to file extensions
-    mime_to_ext = {
-        'application/pdf': '.pdf',
-        'application/msword': '.doc',
-        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
-        'application/vnd.ms-excel': '.xls',
-        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': '.xlsx',
-        'application/vnd.ms-powerpoint': '.ppt',
-        'application/vnd.openxmlformats-officedocument.presentationml.presentation': '.pptx',
-        'text/plain': '.txt',
-        'text/csv': '.csv',
-        'image/jpeg': '.jpg',
-        'image/png': '.png',
-        'image/gif': '.gif',
-        'application/zip': '.zip',
-        'application/x-rar-compressed': '.rar',
-        'application/x-tar': '.tar',
-        'application/x-gzip': '.gz',
-        'audio/mpeg': '.mp3',
-        'video/mp4': '.mp4',
-        'application/json': '.json'
-    }
-    
-    extension = mime_to_ext.get(content_type, '')
+    extension = MIME_TO_EXT.get(content_type.split(';')[0].strip(), '')
     if not extension and '/' in content_type:
         # Use the subtype as extension for unrecognized types
         extension = '.' + content_type.split('/')[1].split(';')[0]
@@ -458,7 +512,7 @@ def download_drive_file(file_id, output_filename=None, logger=None):
         logger = globals()['logger']  # Use module-level logger
     
     # Validate file ID
-    if not file_id or not re.match(r'^[a-zA-Z0-9_-]+$', file_id):
+    if not file_id or not VALID_DRIVE_ID.match(file_id):
         logger.error(f"Invalid Google Drive file ID: {file_id}")
         return None
     
@@ -469,109 +523,110 @@ def download_drive_file(file_id, output_filename=None, logger=None):
     # For large files, Google Drive shows a confirmation page
     # We need to handle this case properly
     
-    session = requests.Session()
-    
-    logger.info(f"Downloading file with ID: {file_id}")
-    
-    # First request to get cookies and confirmation page for large files
-    response = session.get(download_url, stream=True, timeout=30)
-    
-    # Check if we got the download confirmation page
-    content_type = response.headers.get('Content-Type', '')
-    if 'text/html' in content_type and 'virus scan warning' in response.text.lower():
-        # This is a virus scan warning page - we need to parse it
-        confirm_match = re.search(r'name="confirm" value="([^"]*)"', response.text)
-        uuid_match = re.search(r'name="uuid" value="([^"]*)"', response.text)
-        
-        if confirm_match:
-            confirm_code = confirm_match.group(1)
-            logger.info("Large file detected with virus scan warning, bypassing confirmation...")
-            
-            # Build the proper download URL with all parameters
-            download_params = {
-                'id': file_id,
-                'export': 'download',
-                'confirm': confirm_code
-            }
-            
-            if uuid_match:
-                download_params['uuid'] = uuid_match.group(1)
-            
-            # Use drive.usercontent.google.com for direct downloads
-            direct_download_url = "https://drive.usercontent.google.com/download"
+    # Pooled session; every response is closed on the way out (early returns too)
+    with download_session() as session, contextlib.ExitStack() as responses:
+        logger.info(f"Downloading file with ID: {file_id}")
+        
+        # First request to get cookies and confirmation page for large files
+        response = responses.enter_context(session.get(download_url, stream=True, timeout=30))
+        
+        # Check if we got the download confirmation page
+        content_type = response.headers.get('Content-Type', '')
+        if 'text/html' in content_type and 'virus scan warning' in response.text.lower():
+            # This is a virus scan warning page - we need to parse it
+            confirm_match = re.search(r'name="confirm" value="([^"]*)"', response.text)
+            uuid_match = re.search(r'name="uuid" value="([^"]*)"', response.text)
             
-            # Make the download request with all parameters
-            response = session.get(direct_download_url, params=download_params, stream=True, timeout=30)
-    
-    # Also check if the initial URL was already a direct download link
-    elif 'drive.usercontent.google.com' in download_url and response.headers.get('Content-Type', '') == 'text/html':
-        # We might have been given a direct download URL but still got HTML
-        # Just retry the same URL - it should work on second attempt
-        logger.info("Retrying direct download URL...")
-        response = session.get(download_url, stream=True, timeout=30)
-    
-    # Check response
-    if response.status_code != 200:
-        logger.error(f"Error downloading file: HTTP status {response.status_code}")
-        return None
-    
-    # Get filename if not provided
-    if not output_filename:
-        # Try to get from Content-Disposition header
-        filename_extension = get_filename_from_response(response)
-        if filename_extension:
-            if filename_extension.startswith('.'):
-                # It's just an extension
-                output_filename = f"{file_id}{filename_extension}"
+            if confirm_match:
+                confirm_code = confirm_match.group(1)
+                logger.info("Large file detected with virus scan warning, bypassing confirmation...")
+                
+                # Build the proper download URL with all parameters
+                download_params = {
+                    'id': file_id,
+                    'export': 'download',
+                    'confirm': confirm_code
+                }
+                
+                if uuid_match:
+                    download_params['uuid'] = uuid_match.group(1)
+                
+                # Use drive.usercontent.google.com for direct downloads
+                direct_download_url = "https://drive.usercontent.google.com/download"
+                
+                # Make the download request with all parameters
+                response = responses.enter_context(session.get(direct_download_url, params=download_params, stream=True, timeout=30))
+        
+        # Also check if the initial URL was already a direct download link
+        elif 'drive.usercontent.google.com' in download_url and response.headers.get('Content-Type', '') == 'text/html':
+            # We might have been given a direct download URL but still got HTML
+            # Just retry the same URL - it should work on second attempt
+            logger.info("Retrying direct download URL...")
+            response = responses.enter_context(session.get(download_url, stream=True, timeout=30))
+        
+        # Check response
+        if response.status_code != 200:
+            logger.error(f"Error downloading file: HTTP status {response.status_code}")
+            return None
+        
+        # Get filename if not provided
+        if not output_filename:
+            # Try to get from Content-Disposition header
+            filename_extension = get_filename_from_response(response)
+            if filename_extension:
+                if filename_extension.startswith('.'):
+                    # It's just an extension
+                    output_filename = f"{file_id}{filename_extension}"
+                else:
+                    # It's a full filename
+                    output_filename = filename_extension
             else:
-                # It's a full filename
-                output_filename = filename_extension
-        else:
-            # Default filename based on file ID
-            output_filename = f"{file_id}.bin"
-    
-    output_path = os.path.join(DOWNLOADS_DIR, output_filename)
-    lock_file = Path(DOWNLOADS_DIR) / f".{file_id}.lock"
-    
-    # First check with shared lock if file exists
-    with file_lock(lock_file, exclusive=False, timeout=30.0, logger=logger):
-        if os.path.exists(output_path):
-            logger.info(f"File already exists: {output_path}")
-            return output_path
-    
-    # Now acquire exclusive lock for download
-    with file_lock(lock_file, exclusive=True, timeout=300.0, logger=logger):  # 5 min timeout
-        # Double-check after acquiring exclusive lock
+                # Default filename based on file ID
+                output_filename = f"{file_id}.bin"
+        
+        output_path = os.path.join(DOWNLOADS_DIR, output_filename)
+        lock_file = Path(DOWNLOADS_DIR) / f".{file_id}.lock"
+        
+        # Downloads land via os.replace, so output_path is never partial - check it lock-free
         if os.path.exists(output_path):
             logger.info(f"File already exists: {output_path}")
             return output_path
         
-        # Save file
-        try:
-            total_size = int(response.headers.get('content-length', 0))
-            
-            if total_size == 0:
-                logger.warning("Could not determine file size")
-            else:
-                logger.info(f"File size: {total_size / Constants.BYTES_PER_MB:.2f} MB")
+        # Now acquire exclusive lock for download
+        with file_lock(lock_file, exclusive=True, timeout=300.0, logger=logger):  # 5 min timeout
+            # Double-check after acquiring exclusive lock
+            if os.path.exists(output_path):
+                logger.info(f"File already exists: {output_path}")
+                return output_path
             
             # Download to a temporary file first
             temp_path = f"{output_path}.tmp"
             
-            # Use centralized download function (DRY consolidation)
-            success = download_file_with_progress(response, temp_path, total_size, logger)
-            if not success:
-                raise Exception("Download failed")
-            
-            # Move to final location
-            os.replace(temp_path, output_path)
-            
-        except Exception as e:
-            # Clean up temp file on error
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            logger.error(f"Error saving file: {str(e)}")
-            return None
+            # Save file
+            try:
+                total_size = int(response.headers.get('content-length', 0))
+                
+                if total_size == 0:
+                    logger.warning("Could not determine file size")
+                else:
+                    logger.info(f"File size: {total_size / Constants.BYTES_PER_MB:.2f} MB")
+                
+                # Use centralized download function (DRY consolidation)
+                success = download_file_with_progress(response, temp_path, total_size, logger)
+                if not success:
+                    raise Exception("Download failed")
+                
+                # Move to final location
+                os.replace(temp_path, output_path)
+                
+            except Exception as e:
+                # Clean up temp file on error (one unlink, no exists() race)
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temp_path)
+                logger.error(f"Error saving file: {str(e)}")
+                return None
+        
+        return output_path
 
 def save_metadata(file_id, url, metadata, logger=None):
     """Save file metadata to a JSON file"""
@@ -591,11 +646,16 @@ def save_metadata(file_id, url, metadata, logger=None):
     with file_lock(lock_file, exclusive=True, timeout=30.0, logger=logger):
         # Write to temp file first
         temp_file = f"{metadata_file}.tmp"
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
-        
-        # Atomic rename
-        os.replace(temp_file, metadata_file)
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(metadata, indent=2))
+            
+            # Atomic rename
+            os.replace(temp_file, metadata_file)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_file)
+            raise
     
     logger.info(f"Saved metadata to {metadata_file}")
     return metadata_file
@@ -606,7 +666,7 @@ def process_direct_download_url(url, output_filename=None, logger=None):
         logger = globals()['logger']  # Use module-level logger
     
     # Extract parameters from URL
-    parsed_url = urlparse(url)
+    parsed_url = urlsplit(url)
     query_params = parse_qs(parsed_url.query)
     
     file_id = query_params.get('id', [None])[0]
@@ -617,80 +677,78 @@ def process_direct_download_url(url, output_filename=None, logger=None):
     # For direct download URLs, we just download directly
     create_download_dir(DOWNLOADS_DIR, logger)
     
-    # Create a session to handle the download
-    session = requests.Session()
-    
-    # Make the download request
-    response = session.get(url, stream=True, timeout=30)
-    
-    # Handle virus scan warning if present
-    content_type = response.headers.get('Content-Type', '')
-    if 'text/html' in content_type:
-        # Extract filename from HTML if available
-        html_content = response.text
-        filename_match = re.search(r'>([^<]+\.[^<]+)</a>', html_content)
-        suggested_filename = filename_match.group(1) if filename_match else None
-        
-        # Retry the same URL - it should work on second attempt
-        logger.info("Retrying direct download URL after virus scan page...")
-        response = session.get(url, stream=True, timeout=30)
-    else:
-        suggested_filename = None
-    
-    if response.status_code != 200:
-        logger.error(f"Error downloading file: HTTP status {response.status_code}")
-        return None
-    
-    # Determine filename
-    if not output_filename:
-        # Try Content-Disposition header
-        cd = response.headers.get('Content-Disposition', '')
-        filename_match = re.search(r'filename="?([^";]+)"?', cd)
-        if filename_match:
-            output_filename = filename_match.group(1)
-        elif suggested_filename:
-            output_filename = suggested_filename
+    # Pooled session; every response is closed on the way out (early returns too)
+    with download_session() as session, contextlib.ExitStack() as responses:
+        # Make the download request
+        response = responses.enter_context(session.get(url, stream=True, timeout=30))
+        
+        # Handle virus scan warning if present
+        content_type = response.headers.get('Content-Type', '')
+        if 'text/html' in content_type:
+            # Extract filename from HTML if available
+            html_content = response.text
+            filename_match = re.search(r'>([^<]+\.[^<]+)</a>', html_content)
+            suggested_filename = filename_match.group(1) if filename_match else None
+            
+            # Retry the same URL - it should work on second attempt
+            logger.info("Retrying direct download URL after virus scan page...")
+            response = responses.enter_context(session.get(url, stream=True, timeout=30))
         else:
-            output_filename = f"{file_id}.bin"
-    
-    output_path = os.path.join(DOWNLOADS_DIR, output_filename)
-    lock_file = Path(DOWNLOADS_DIR) / f".{file_id}.lock"
-    
-    # Check if file exists
-    with file_lock(lock_file, exclusive=False, timeout=30.0, logger=logger):
-        if os.path.exists(output_path):
-            logger.info(f"File already exists: {output_path}")
-            return output_path
-    
-    # Download with exclusive lock
-    with file_lock(lock_file, exclusive=True, timeout=300.0, logger=logger):
+            suggested_filename = None
+        
+        if response.status_code != 200:
+            logger.error(f"Error downloading file: HTTP status {response.status_code}")
+            return None
+        
+        # Determine filename
+        if not output_filename:
+            # Try Content-Disposition header
+            cd = response.headers.get('Content-Disposition', '')
+            filename_match = CONTENT_DISPOSITION_FILENAME.search(cd)
+            if filename_match:
+                output_filename = filename_match.group(1)
+            elif suggested_filename:
+                output_filename = suggested_filename
+            else:
+                output_filename = f"{file_id}.bin"
+        
+        output_path = os.path.join(DOWNLOADS_DIR, output_filename)
+        lock_file = Path(DOWNLOADS_DIR) / f".{file_id}.lock"
+        
+        # Check if file exists (os.replace makes the final path atomic, no lock needed)
         if os.path.exists(output_path):
             logger.info(f"File already exists: {output_path}")
             return output_path
         
-        # Download to temp file
-        temp_path = f"{output_path}.tmp"
-        total_size = int(response.headers.get('Content-Length', 0))
-        
-        if total_size > 0:
-            logger.info(f"File size: {total_size / Constants.BYTES_PER_MB:.2f} MB")
-        
-        try:
-            # Use centralized download function (DRY consolidation)
-            success = download_file_with_progress(response, temp_path, total_size, logger)
-            if not success:
-                raise Exception("Download failed")
+        # Download with exclusive lock
+        with file_lock(lock_file, exclusive=True, timeout=300.0, logger=logger):
+            if os.path.exists(output_path):
+                logger.info(f"File already exists: {output_path}")
+                return output_path
             
-            # Move to final location
-            os.replace(temp_path, output_path)
-            logger.success(f"Downloaded file to {output_path}")
-            return output_path
+            # Download to temp file
+            temp_path = f"{output_path}.tmp"
+            total_size = int(response.headers.get('Content-Length', 0))
             
-        except Exception as e:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            logger.error(f"Error saving file: {str(e)}")
-            return None
+            if total_size > 0:
+                logger.info(f"File size: {total_size / Constants.BYTES_PER_MB:.2f} MB")
+            
+            try:
+                # Use centralized download function (DRY consolidation)
+                success = download_file_with_progress(response, temp_path, total_size, logger)
+                if not success:
+                    raise Exception("Download failed")
+                
+                # Move to final location
+                os.replace(temp_path, output_path)
+                logger.success(f"Downloaded file to {output_path}")
+                return output_path
+                
+            except Exception as e:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temp_path)
+                logger.error(f"Error saving file: {str(e)}")
+                return None
 
 
 def _download_individual_file_with_context(url: str, row_context: RowContext, logger) -> DownloadResult:
@@ -802,7 +860,7 @@ def process_drive_url(url, output_filename=None, save_metadata_flag=False, logge
         # Handle metadata if requested
         metadata_path = None
         if downloaded_path and save_metadata_flag:
-            parsed_url = urlparse(url)
+            parsed_url = urlsplit(url)
             query_params = parse_qs(parsed_url.query)
             file_id = query_params.get('id', [None])[0]
             
@@ -7,12 +7,15 @@ import sys
 import csv
 import json
 import time
+import random
 import re
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path to access utils
-sys.path.insert(0, '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal')
+UTILS_ROOT = '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal'
+if UTILS_ROOT not in sys.path:
+    sys.path.insert(0, UTILS_ROOT)
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -23,6 +26,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from utils.config import get_config
 from utils.logging_config import get_logger
 from utils.download_drive import extract_file_id
+from utils.data_processing import loads_json
 
 logger = get_logger(__name__)
 config = get_config()
@@ -30,6 +34,44 @@ config = get_config()
 # Increase CSV field size limit
 csv.field_size_limit(config.get('file_processing.max_csv_field_size', sys.maxsize))
 
+# Mapping status -> report bucket, and statuses listed under "Failed downloads"
+STATUS_BUCKETS = {
+    'success': 'success',
+    'pending': 'pending',
+    'no_download_button': 'no_button',
+    'timeout': 'timeout',
+    'error': 'failed',
+    'download_failed': 'failed',
+}
+FAILED_STATUSES = frozenset({'error', 'download_failed', 'no_download_button', 'timeout'})
+
+# Report layout, formatted once per report instead of one log call per line
+REPORT_SUMMARY_TEMPLATE = (
+    "Total files: {total}\n"
+    "✅ Successfully downloaded: {success}\n"
+    "⏳ Pending: {pending}\n"
+    "❌ Failed: {failed}\n"
+    "🚫 No download button: {no_button}\n"
+    "⏱️ Timeout: {timeout}"
+)
+REPORT_FAILED_LINE = "  - {file_id}: {names} ({status})"
+
+# File size shown on Drive's virus-scan warning page, e.g. "(4.8G)"
+HTML_FILE_SIZE_PATTERN = re.compile(r'\(([0-9.]+)([GMK])\)')
+SIZE_UNIT_TO_MB = {'G': 1024.0, 'M': 1.0, 'K': 1.0 / 1024}
+
+
+def _read_json(path):
+    """Load a JSON state file (orjson when available, via loads_json)"""
+    return loads_json(path.read_bytes())
+
+
+def _write_json(path, data):
+    """Write a JSON state file with 2-space indentation"""
+    with open(path, 'w') as f:
+        f.write(json.dumps(data, indent=2))
+
+
 class DriveFileDownloader:
     def __init__(self):
         self.output_csv = config.get('paths.output_csv', '/home/Mike/Xenodex/fulfillment/data/output.csv')
@@ -38,6 +80,11 @@ class DriveFileDownloader:
         self.files_dir = self.drive_downloads_dir / 'files'
         self.mapping_file = self.drive_downloads_dir / 'download_mapping.json'
         self.mapping = {}
+        # Parsed preview-page sizes: path -> [mtime_ns, size, size_mb, size_label],
+        # persisted across runs and written once per run when it changed
+        self.size_cache_file = self.drive_downloads_dir / 'html_size_cache.json'
+        self.size_cache = {}
+        self._size_cache_dirty = False
         self.driver = None
         
         # Create directories if they don't exist
@@ -45,8 +92,12 @@ class DriveFileDownloader:
         
         # Load existing mapping if it exists
         if self.mapping_file.exists():
-            with open(self.mapping_file, 'r') as f:
-                self.mapping = json.load(f)
+            self.mapping = _read_json(self.mapping_file)
+        if self.size_cache_file.exists():
+            try:
+                self.size_cache = _read_json(self.size_cache_file)
+            except ValueError:
+                logger.warning(f"Ignoring unreadable size cache {self.size_cache_file}")
     
     # File ID extraction moved to utils.download_drive.extract_file_id for consistency
     
@@ -118,6 +169,35 @@ class DriveFileDownloader:
         logger.info(f"Found {len(html_files)} HTML files to process")
         return html_files
     
+    def get_html_file_size(self, html_path):
+        """Return (size_mb, size_label) from a saved preview page, or (None, None).
+        
+        Results are cached per path and reused while its mtime and size are
+        unchanged, so unchanged pages are only scanned once across runs. Otherwise streams the file line by line and
+        stops at the first size marker instead of reading whole (often multi-MB)
+        HTML pages into memory.
+        """
+        st = os.stat(html_path)
+        cache_key = str(html_path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = self.size_cache.get(cache_key)
+        if isinstance(cached, list) and cached[:2] == stamp:
+            return tuple(cached[2:])
+        
+        result = (None, None)
+        with open(html_path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                size_match = HTML_FILE_SIZE_PATTERN.search(line)
+                if size_match:
+                    size_value, size_unit = size_match.groups()
+                    result = (float(size_value) * SIZE_UNIT_TO_MB[size_unit], f"{size_value}{size_unit}")
+                    break
+        
+        # A changed page overwrites its own entry, so stale stamps never accumulate
+        self.size_cache[cache_key] = stamp + list(result)
+        self._size_cache_dirty = True
+        return result
+    
     def setup_chrome_driver(self):
         """Configure Chrome for automatic downloads"""
         logger.info("Setting up Chrome driver with download preferences...")
@@ -152,15 +232,21 @@ class DriveFileDownloader:
             "downloadPath": str(self.files_dir.absolute())
         })
     
-    def wait_for_download(self, timeout=3600, check_interval=5):
-        """Wait for download to complete by monitoring the downloads directory"""
+    def wait_for_download(self, timeout=3600, check_interval=5, stall_timeout=60):
+        """Wait for download to complete by monitoring the downloads directory.
+
+        Polls with exponential backoff (0.5s doubling up to check_interval, +/-20% jitter)
+        so short downloads are picked up quickly without hammering the filesystem.
+        """
         logger.info("Waiting for download to complete...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()  # Monotonic - immune to wall-clock adjustments
         last_size = 0
-        no_progress_count = 0
+        last_check = start_time
+        last_progress = start_time
+        delay = 0.5
         
-        while time.time() - start_time < timeout:
+        while time.perf_counter() - start_time < timeout:
             # Check for .crdownload files (Chrome temporary download files)
             temp_files = list(self.files_dir.glob('*.crdownload'))
             
@@ -170,42 +256,52 @@ class DriveFileDownloader:
                 return True
             
             # Check download progress
-            if temp_files:
-                current_file = temp_files[0]
+            current_file = temp_files[0]
+            try:
                 current_size = current_file.stat().st_size
-                
-                # Show progress
-                size_mb = current_size / (1024 * 1024)
-                elapsed = time.time() - start_time
-                speed_mb = (current_size - last_size) / (1024 * 1024) / check_interval if last_size > 0 else 0
-                
-                logger.info(f"Download progress: {size_mb:.1f} MB ({speed_mb:.1f} MB/s)")
-                
-                # Check if download is stalled
-                if current_size == last_size:
-                    no_progress_count += 1
-                    if no_progress_count > 12:  # No progress for 60 seconds
-                        logger.warning("Download appears to be stalled")
-                        return False
-                else:
-                    no_progress_count = 0
-                
-                last_size = current_size
+            except FileNotFoundError:
+                # Chrome renamed the temp file between glob and stat - download just finished
+                continue
+            
+            # Show progress
+            now = time.perf_counter()
+            size_mb = current_size / (1024 * 1024)
+            interval = max(now - last_check, 1e-6)
+            speed_mb = (current_size - last_size) / (1024 * 1024) / interval if last_size > 0 else 0
+            
+            logger.info(f"Download progress: {size_mb:.1f} MB ({speed_mb:.1f} MB/s)")
             
-            time.sleep(check_interval)
+            # Check if download is stalled
+            if current_size == last_size:
+                if now - last_progress > stall_timeout:
+                    logger.warning("Download appears to be stalled")
+                    return False
+            else:
+                last_progress = now
+            
+            last_size = current_size
+            last_check = now
+            
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(check_interval, delay * 2)
         
         logger.warning(f"Download timeout after {timeout} seconds")
         return False
     
     def get_latest_download(self):
         """Get the most recently downloaded file"""
-        files = [f for f in self.files_dir.iterdir() if f.is_file() and not f.name.endswith('.crdownload')]
-        if not files:
-            return None
+        # Single scandir pass tracking the newest mtime (no separate stat per candidate)
+        latest_path = None
+        latest_mtime = None
+        with os.scandir(self.files_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.crdownload') or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_path, latest_mtime = entry.path, mtime
         
-        # Get the most recent file
-        latest_file = max(files, key=lambda f: f.stat().st_mtime)
-        return latest_file
+        return Path(latest_path) if latest_path else None
     
     def process_html_file(self, html_file):
         """Process a single HTML file and download the actual file"""
@@ -349,8 +445,18 @@ class DriveFileDownloader:
     
     def save_mapping(self):
         """Save mapping to JSON file"""
-        with open(self.mapping_file, 'w') as f:
-            json.dump(self.mapping, f, indent=2)
+        _write_json(self.mapping_file, self.mapping)
+    
+    def save_size_cache(self):
+        """Write the HTML size cache if it changed, dropping pages that no longer exist"""
+        stale = [path for path, entry in self.size_cache.items()
+                 if not isinstance(entry, list) or len(entry) != 4 or not os.path.exists(path)]
+        for path in stale:
+            del self.size_cache[path]
+        
+        if self._size_cache_dirty or stale:
+            _write_json(self.size_cache_file, self.size_cache)
+            self._size_cache_dirty = False
     
     def generate_report(self):
         """Generate summary report of downloads"""
@@ -368,34 +474,28 @@ class DriveFileDownloader:
             'error': 0
         }
         
+        failed_items = []
         for file_id, info in self.mapping.items():
             status = info.get('status', 'pending')
-            if status == 'success':
-                stats['success'] += 1
-            elif status == 'pending':
-                stats['pending'] += 1
-            elif status == 'no_download_button':
-                stats['no_button'] += 1
-            elif status == 'timeout':
-                stats['timeout'] += 1
-            elif status in ['error', 'download_failed']:
-                stats['failed'] += 1
+            bucket = STATUS_BUCKETS.get(status)
+            if bucket:
+                stats[bucket] += 1
+            if status in FAILED_STATUSES:
+                failed_items.append((file_id, info))
         
-        logger.info(f"Total files: {stats['total']}")
-        logger.info(f"✅ Successfully downloaded: {stats['success']}")
-        logger.info(f"⏳ Pending: {stats['pending']}")
-        logger.info(f"❌ Failed: {stats['failed']}")
-        logger.info(f"🚫 No download button: {stats['no_button']}")
-        logger.info(f"⏱️ Timeout: {stats['timeout']}")
+        logger.info(REPORT_SUMMARY_TEMPLATE.format(**stats))
         
         # List failed files
         if stats['failed'] > 0 or stats['no_button'] > 0:
-            logger.info("\nFailed downloads:")
-            for file_id, info in self.mapping.items():
-                if info.get('status') in ['error', 'download_failed', 'no_download_button', 'timeout']:
-                    rows = info.get('rows', [])
-                    names = [r['name'] for r in rows]
-                    logger.info(f"  - {file_id}: {', '.join(names)} ({info.get('status')})")
+            failed_lines = "\n".join(
+                REPORT_FAILED_LINE.format(
+                    file_id=file_id,
+                    names=', '.join(r['name'] for r in info.get('rows', [])),
+                    status=info.get('status'),
+                )
+                for file_id, info in failed_items
+            )
+            logger.info("\nFailed downloads:\n" + failed_lines)
     
     def run(self):
         """Main execution method"""
@@ -437,8 +537,9 @@ class DriveFileDownloader:
             # Generate final report
             self.generate_report()
             
-            # Save final mapping
+            # Save final mapping and the size cache (once per run)
             self.save_mapping()
+            self.save_size_cache()
 
 if __name__ == "__main__":
     downloader = DriveFileDownloader()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import sys, os
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+LOCAL_UTILS_DIR = os.path.join(os.path.dirname(__file__), "..", "utils")
+if LOCAL_UTILS_DIR not in sys.path:
+    sys.path.append(LOCAL_UTILS_DIR)
 from download_utils import download_file_with_progress
 from config import Constants
 """
@@ -10,13 +12,16 @@ Handles direct drive.usercontent.google.com URLs properly.
 import os
 import sys
 import re
+import contextlib
 import requests
 import time
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 
 # Add parent directory to path
-sys.path.insert(0, '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal')
+UTILS_ROOT = '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal'
+if UTILS_ROOT not in sys.path:
+    sys.path.insert(0, UTILS_ROOT)
 
 from utils.logging_config import get_logger
 from utils.validation import validate_url, ValidationError
@@ -28,7 +33,7 @@ DOWNLOADS_DIR = "/home/Mike/Xenodex/fulfillment/data/drive_downloads"
 
 def extract_file_info_from_url(url):
     """Extract file ID and other parameters from the URL"""
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
     params = parse_qs(parsed.query)
     
     file_id = params.get('id', [None])[0]
@@ -127,6 +132,9 @@ def download_large_drive_file(url, output_dir=DOWNLOADS_DIR):
             success = download_file_with_progress(response, temp_path, total_size, logger)
             if not success:
                 logger.error("Download failed")
+                # Drop the partial file (one unlink, no exists() race)
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temp_path)
                 return None
             
             # Move to final location
@@ -138,8 +146,8 @@ def download_large_drive_file(url, output_dir=DOWNLOADS_DIR):
             return output_path
             
         except Exception as e:
-            # Clean up on error
-            if os.path.exists(temp_path):
+            # Clean up the partial file (one unlink, no exists() race)
+            with contextlib.suppress(FileNotFoundError):
                 os.unlink(temp_path)
             logger.error(f"Download failed: {str(e)}")
             return None
@@ -5,9 +5,14 @@ Download large Drive files with extended timeouts and better progress tracking
 import sys
 import os
 
-sys.path.insert(0, '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal')
-
-from scripts.download_drive_files_from_html import DriveFileDownloader
+# Resolve scripts normally (installed / PYTHONPATH); only fall back to mutating sys.path if that fails
+UTILS_ROOT = '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal'
+try:
+    from scripts.download_drive_files_from_html import DriveFileDownloader
+except ImportError:
+    if UTILS_ROOT not in sys.path:
+        sys.path.insert(0, UTILS_ROOT)
+    from scripts.download_drive_files_from_html import DriveFileDownloader
 from pathlib import Path
 import time
 
@@ -31,30 +36,14 @@ class LargeFileDownloader(DriveFileDownloader):
             logger.info(f"File {file_id} already processed ({status}), skipping...")
             return True
             
-        # Read HTML to check file size
-        with open(html_file['path'], 'r', encoding='utf-8') as f:
-            html_content = f.read()
-            
-        # Look for file size in HTML
-        import re
-        size_match = re.search(r'\(([0-9.]+)([GMK])\)', html_content)
+        # Check file size from the preview page (streamed, stops at first match)
+        size_mb, size_label = self.get_html_file_size(html_file['path'])
         
-        if size_match:
-            size_value = float(size_match.group(1))
-            size_unit = size_match.group(2)
-            
-            # Convert to GB
-            if size_unit == 'G':
-                size_gb = size_value
-            elif size_unit == 'M':
-                size_gb = size_value / 1024
-            elif size_unit == 'K':
-                size_gb = size_value / (1024 * 1024)
-            else:
-                size_gb = 0
+        if size_mb is not None:
+            size_gb = size_mb / 1024
             
             if size_gb < self.min_size_gb:
-                print(f"Skipping {file_id} - file too small: {size_value}{size_unit} ({size_gb:.2f} GB)")
+                print(f"Skipping {file_id} - file too small: {size_label} ({size_gb:.2f} GB)")
                 return False
                 
             # Log large file processing
@@ -62,21 +51,21 @@ class LargeFileDownloader(DriveFileDownloader):
             names = [r['name'] for r in rows]
             print(f"\n{'='*60}")
             print(f"Processing LARGE file: {file_id}")
-            print(f"Size: {size_value}{size_unit}")
+            print(f"Size: {size_label}")
             print(f"Person: {', '.join(names)}")
             print(f"{'='*60}")
             
             self.processed_large.append({
                 'file_id': file_id,
-                'size': f"{size_value}{size_unit}",
+                'size': size_label,
                 'size_gb': size_gb,
                 'names': names
             })
         
         # Process with extended timeout
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = super().process_html_file(html_file)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         if result:
             print(f"✅ Download completed in {elapsed/60:.1f} minutes")
@@ -90,10 +79,13 @@ class LargeFileDownloader(DriveFileDownloader):
         super().generate_report()
         
         if self.processed_large:
-            print(f"\n📦 Processed {len(self.processed_large)} large files (>= {self.min_size_gb} GB):")
-            for file_info in self.processed_large:
-                status = self.mapping.get(file_info['file_id'], {}).get('status', 'unknown')
-                print(f"  - {file_info['file_id']}: {file_info['size']} - {', '.join(file_info['names'])} [{status}]")
+            lines = [f"\n📦 Processed {len(self.processed_large)} large files (>= {self.min_size_gb} GB):"]
+            lines.extend(
+                f"  - {file_info['file_id']}: {file_info['size']} - {', '.join(file_info['names'])} "
+                f"[{self.mapping.get(file_info['file_id'], {}).get('status', 'unknown')}]"
+                for file_info in self.processed_large
+            )
+            print("\n".join(lines))
 
 if __name__ == "__main__":
     import argparse
@@ -125,17 +117,18 @@ if __name__ == "__main__":
             
             # Find first large file
             for html_file in html_files:
-                with open(html_file['path'], 'r') as f:
-                    if 'G)' in f.read():
-                        print(f"Testing with single file: {html_file['file_id']}")
-                        downloader.setup_chrome_driver()
-                        downloader.process_html_file(html_file)
-                        downloader.save_mapping()
-                        break
+                size_mb, _ = downloader.get_html_file_size(html_file['path'])
+                if size_mb is not None and size_mb >= 1024:
+                    print(f"Testing with single file: {html_file['file_id']}")
+                    downloader.setup_chrome_driver()
+                    downloader.process_html_file(html_file)
+                    downloader.save_mapping()
+                    break
             
             if downloader.driver:
                 downloader.driver.quit()
             downloader.generate_report()
+            downloader.save_size_cache()
         
         downloader.run = test_run
     
@@ -5,9 +5,14 @@ Download only small Drive files (< 100MB) for testing
 import sys
 import os
 
-sys.path.insert(0, '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal')
-
-from scripts.download_drive_files_from_html import DriveFileDownloader
+# Resolve scripts normally (installed / PYTHONPATH); only fall back to mutating sys.path if that fails
+UTILS_ROOT = '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal'
+try:
+    from scripts.download_drive_files_from_html import DriveFileDownloader
+except ImportError:
+    if UTILS_ROOT not in sys.path:
+        sys.path.insert(0, UTILS_ROOT)
+    from scripts.download_drive_files_from_html import DriveFileDownloader
 from pathlib import Path
 
 class SmallFileDownloader(DriveFileDownloader):
@@ -31,40 +36,22 @@ class SmallFileDownloader(DriveFileDownloader):
                 print(f"Skipping {file_id} - partial download already exists: {pf.name}")
                 return False
         
-        # Read HTML to check file size
-        with open(html_file['path'], 'r', encoding='utf-8') as f:
-            html_content = f.read()
-            
-        # Look for file size in HTML (e.g., "4.8G" or "100M")
-        import re
-        size_match = re.search(r'\(([0-9.]+)([GMK])\)', html_content)
+        # Check file size from the preview page (streamed, stops at first match)
+        size_mb, size_label = self.get_html_file_size(html_file['path'])
         
-        if size_match:
-            size_value = float(size_match.group(1))
-            size_unit = size_match.group(2)
-            
-            # Convert to MB
-            if size_unit == 'G':
-                size_mb = size_value * 1024
-            elif size_unit == 'M':
-                size_mb = size_value
-            elif size_unit == 'K':
-                size_mb = size_value / 1024
-            else:
-                size_mb = 0
-            
+        if size_mb is not None:
             if size_mb > self.max_size_mb:
-                print(f"Skipping {file_id} - file too large: {size_value}{size_unit} ({size_mb:.1f} MB)")
+                print(f"Skipping {file_id} - file too large: {size_label} ({size_mb:.1f} MB)")
                 self.skipped_large.append({
                     'file_id': file_id,
-                    'size': f"{size_value}{size_unit}",
+                    'size': size_label,
                     'size_mb': size_mb
                 })
                 
                 # Update mapping
                 if file_id in self.mapping:
                     self.mapping[file_id]['status'] = 'skipped_too_large'
-                    self.mapping[file_id]['file_size'] = f"{size_value}{size_unit}"
+                    self.mapping[file_id]['file_size'] = size_label
                 
                 return False
         
@@ -76,11 +63,12 @@ class SmallFileDownloader(DriveFileDownloader):
         super().generate_report()
         
         if self.skipped_large:
-            print(f"\n📦 Skipped {len(self.skipped_large)} large files (> {self.max_size_mb} MB):")
+            lines = [f"\n📦 Skipped {len(self.skipped_large)} large files (> {self.max_size_mb} MB):"]
             for file_info in self.skipped_large:
                 rows = self.mapping.get(file_info['file_id'], {}).get('rows', [])
-                names = [r['name'] for r in rows]
-                print(f"  - {file_info['file_id']}: {file_info['size']} - {', '.join(names)}")
+                names = ', '.join(r['name'] for r in rows)
+                lines.append(f"  - {file_info['file_id']}: {file_info['size']} - {names}")
+            print("\n".join(lines))
 
 if __name__ == "__main__":
     import argparse
@@ -13,9 +13,8 @@ def download_file_with_progress(url: str, output_path: str, **kwargs):
     # Create parent directory
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     
-    # Create empty file for dry run
-    with open(output_path, 'w') as f:
-        f.write("# DRY RUN FILE - NOT ACTUAL DOWNLOAD\n")
+    # Create placeholder file for dry run (single open/write/close)
+    Path(output_path).write_text("# DRY RUN FILE - NOT ACTUAL DOWNLOAD\n")
     
     return True
 
@@ -420,24 +420,15 @@ def download_video(url, transcript_only=False, resolution="720", output_format="
             info_cmd = [
                 yt_dlp_path,
                 "--flat-playlist",  # Get playlist info without downloading videos
-                "-j",               # Output JSON format
+                "--print", "id",    # Emit only the video IDs - no per-entry JSON to parse
                 url
             ]
             
             try:
                 import subprocess
                 result = subprocess.run(info_cmd, capture_output=True, text=True, check=True)
-                # Each line is a JSON object with video info
-                video_ids = []
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        import json
-                        try:
-                            video_info = json.loads(line)
-                            if 'id' in video_info:
-                                video_ids.append(video_info['id'])
-                        except json.JSONDecodeError:
-                            continue
+                # One video ID per line
+                video_ids = [line.strip() for line in result.stdout.splitlines() if line.strip()]
                 
                 if not video_ids:
                     logger.error("No videos found in YouTube playlist")
@@ -1,10 +1,14 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import os
 import json
+import random
 import time
 import atexit
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import NamedTuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -52,6 +56,107 @@ GOOGLE_SHEET_CACHE_FILE = os.path.join(CACHE_DIR, "google_sheet_cache.html")
 
 # Selenium driver functions are now imported from patterns.py (DRY consolidation)
 
+# Prefer the C-based lxml parser when installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+class RetrySettings(NamedTuple):
+    """Retry policy for document text extraction, read from config once"""
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+
+RETRY_SETTINGS = RetrySettings(
+    max_attempts=config.get("retry.max_attempts", 3),
+    base_delay=config.get("retry.base_delay", 2.0),
+    max_delay=config.get("retry.max_delay", 60.0),
+)
+
+# Pages larger than this are not worth downloading for link extraction
+MAX_HTML_BYTES = config.get("web_scraping.max_html_bytes", 50 * 1024 * 1024)
+
+# Runs of characters not safe in debug dump filenames (covers '://', '/', '?', '=', '&', '#')
+UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9._-]+')
+
+# Link extraction only needs anchors, so skip building the rest of the tree
+ANCHOR_STRAINER = SoupStrainer('a', href=True)
+# Google Docs also mine og:description/description <meta> tags for links
+DOC_STRAINER = SoupStrainer(['a', 'meta'])
+
+# Link filters used by extract_links - built once instead of per link
+INFRASTRUCTURE_LINK_MARKERS = (
+    'gstatic.com',
+    'apis.google.com',
+    'script.google.com',
+    'chrome.google.com',
+    'clients6.google.com',
+    '/static/',
+    'accounts.google.com',
+    'docs.google.com/picker',
+    'docs.google.com/relay.html',
+    'contacts.google.com',
+    'lh7-rt.googleusercontent.com',
+    'googleusercontent.com/docs',
+    'schema.org',
+    'w3.org',
+    '#',
+    'docs.google.com/static',
+    'docs.google.com/preview',
+    'docs.google.com?usp=',
+    '",s-blob-v1-IMAGE-',
+    '"',
+    'support.google.com',
+    "}.config['csfu']",
+)
+INFRASTRUCTURE_LINK_SUFFIXES = ('.js', '.css', '.png', '.gif')
+CODE_LINK_MARKERS = ('{', '}', '[', ']', 'si:', 'ei:', 'sm:', 'spi:', 'docs/fonts', '.woff')
+
+# Polled while a Google Doc renders - sums text lengths rather than concatenating the whole
+# document into a new string on every poll just to read its length
+DOC_CONTENT_LENGTH_JS = """
+    var length = (document.body.innerText || '').length;
+    var editables = document.querySelectorAll('[contenteditable="true"]');
+    for (var i = 0; i < editables.length; i++) {
+        length += (editables[i].innerText || '').length;
+    }
+    return length;
+"""
+
+def _wait_for_stable_content(driver, max_wait, stable_window=2.0, min_length=100):
+    """Poll rendered text length until it stops changing for stable_window seconds.
+    
+    Adaptive backoff: polls fast while the page is still rendering, then backs off
+    (x1.5, capped) instead of fixed sleeps. Never waits past max_wait seconds.
+    """
+    previous_content_length = 0
+    delay = 0.5
+    max_delay = 4.0
+    start_wait = time.perf_counter()
+    last_change = start_wait
+    
+    while time.perf_counter() - start_wait < max_wait:
+        try:
+            current_content_length = driver.execute_script(DOC_CONTENT_LENGTH_JS)
+            
+            now = time.perf_counter()
+            if current_content_length != previous_content_length:
+                previous_content_length = current_content_length
+                last_change = now
+            elif current_content_length > min_length and now - last_change >= stable_window:
+                logger.info(f"Content stabilized at {current_content_length} chars")
+                break
+        except Exception:
+            pass
+        
+        remaining = max_wait - (time.perf_counter() - start_wait)
+        time.sleep(max(0.0, min(delay, remaining)))
+        delay = min(delay * 1.5, max_delay)
+    
+    return previous_content_length
+
 @rate_limit('selenium')
 @with_standard_error_handling("Selenium HTML extraction", "")
 def get_html_with_selenium(url, debug=False):
@@ -68,8 +173,8 @@ def get_html_with_selenium(url, debug=False):
         WebDriverWait(driver, 30).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        # Extra wait for Google Docs to render
-        time.sleep(5)
+        # Extra wait for Google Docs to render - returns as soon as the text stops changing
+        _wait_for_stable_content(driver, max_wait=5, stable_window=1.0)
         
         # For Google Docs, try scrolling to ensure all content is loaded
         if "docs.google.com/document" in url:
@@ -89,7 +194,7 @@ def get_html_with_selenium(url, debug=False):
             from .path_utils import ensure_directory
             ensure_directory(CACHE_DIR)
                 
-            debug_file = os.path.join(CACHE_DIR, f"selenium_debug_{url.replace('://', '_').replace('/', '_').replace('?', '_').replace('=', '_')}.html")
+            debug_file = os.path.join(CACHE_DIR, f"selenium_debug_{UNSAFE_FILENAME_CHARS.sub('_', url)}.html")
             with open(debug_file, 'w', encoding='utf-8') as f:
                 f.write(html)
             logger.debug(f"Saved Selenium debug HTML to {debug_file}")
@@ -137,48 +242,19 @@ def extract_google_doc_text(url, driver=None, prefer_http=True):
         return ""
     
     logger.info(f"Loading Google Doc with enhanced extraction: {url}")
-    start_time = time.time()
+    start_time = time.perf_counter()  # Monotonic - immune to wall-clock adjustments
     driver.get(url)
     
     # Wait for page to load
     WebDriverWait(driver, 30).until(
         EC.presence_of_element_located((By.TAG_NAME, "body"))
     )
-    load_time = time.time() - start_time
+    load_time = time.perf_counter() - start_time
     logger.info(f"Page loaded in {load_time:.2f} seconds")
     
-    # Dynamic wait for content to stabilize
+    # Dynamic wait for content to stabilize (bounded by a monotonic deadline)
     logger.info("Waiting for content to stabilize...")
-    previous_content_length = 0
-    stable_checks = 0
-    max_wait = 30
-    start_wait = time.time()
-    
-    while time.time() - start_wait < max_wait:
-        try:
-            current_content_length = driver.execute_script("""
-                var content = document.body.innerText || '';
-                var editables = document.querySelectorAll('[contenteditable="true"]');
-                for (var i = 0; i < editables.length; i++) {
-                    content += editables[i].innerText || '';
-                }
-                return content.length;
-            """)
-            
-            if current_content_length > previous_content_length:
-                previous_content_length = current_content_length
-                stable_checks = 0
-                time.sleep(2)
-            elif current_content_length == previous_content_length and current_content_length > 100:
-                stable_checks += 1
-                if stable_checks >= 2:
-                    logger.info(f"Content stabilized at {current_content_length} chars")
-                    break
-                time.sleep(1)
-            else:
-                time.sleep(2)
-        except:
-            time.sleep(2)
+    _wait_for_stable_content(driver, max_wait=30)
     
     # Enhanced JavaScript-based extraction
     logger.info("Extracting content with JavaScript...")
@@ -243,7 +319,7 @@ def extract_google_doc_text(url, driver=None, prefer_http=True):
     if len(text_content) < 50:
         logger.warning("Low content extraction, trying fallback...")
         # Fallback to BeautifulSoup extraction
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(driver.page_source, HTML_PARSER)
         body = soup.find('body')
         if body:
             fallback_text = body.get_text(separator=' ', strip=True)
@@ -267,7 +343,9 @@ def extract_google_doc_text(url, driver=None, prefer_http=True):
 def extract_text_with_retry(doc_url, max_attempts=None):
     """Extract text from document with retry logic (DRY consolidation)"""
     if max_attempts is None:
-        max_attempts = config.get("retry.max_attempts", 3)
+        max_attempts = RETRY_SETTINGS.max_attempts
+    
+    base_delay, max_delay = RETRY_SETTINGS.base_delay, RETRY_SETTINGS.max_delay
     
     for attempt in range(max_attempts):
         try:
@@ -281,10 +359,12 @@ def extract_text_with_retry(doc_url, max_attempts=None):
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Attempt {attempt + 1} failed: {error_msg}")
-            if attempt < max_attempts - 1:
-                retry_delay = config.get("retry.base_delay", 2.0)
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+        
+        if attempt < max_attempts - 1:
+            # Exponential backoff with full jitter so batch retries don't land in lockstep
+            retry_delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+            logger.info(f"Retrying in {retry_delay:.1f} seconds...")
+            time.sleep(retry_delay)
     
     return "", f"Failed after {max_attempts} attempts"
 
@@ -327,12 +407,28 @@ def get_html(url, debug=False):
         response = http_get(url, stream=True)
         response.raise_for_status()
         
-        # Stream HTML content to avoid loading large pages into memory
-        html = ""
-        chunk_size = 8192
-        for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=True):
-            if chunk:
-                html += chunk
+        # Skip bodies we would only fail to parse (PDFs, media, archives) or
+        # that are too large, before downloading them
+        content_type = response.headers.get('Content-Type', '')
+        if content_type and 'html' not in content_type and not content_type.startswith('text/'):
+            logger.info(f"Skipping non-HTML response ({content_type}) for {url}")
+            response.close()
+            return ""
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > MAX_HTML_BYTES:
+            logger.warning(f"Skipping {url}: {int(content_length)} bytes exceeds {MAX_HTML_BYTES}")
+            response.close()
+            return ""
+        
+        # Stream HTML content and join once - repeated str += copies the
+        # whole page on every chunk
+        chunks = [chunk for chunk in response.iter_content(chunk_size=65536, decode_unicode=True) if chunk]
+        if chunks and isinstance(chunks[0], bytes):
+            # requests yields bytes when the response declares no charset
+            html = b''.join(chunks).decode(response.apparent_encoding or 'utf-8', errors='replace')
+        else:
+            html = ''.join(chunks)
+        del chunks
         
         # For debugging, save the HTML content
         if debug:
@@ -340,30 +436,17 @@ def get_html(url, debug=False):
             from .path_utils import ensure_directory
             ensure_directory(CACHE_DIR)
                 
-            debug_file = os.path.join(CACHE_DIR, f"debug_{url.replace('://', '_').replace('/', '_').replace('?', '_').replace('=', '_')}.html")
+            debug_file = os.path.join(CACHE_DIR, f"debug_{UNSAFE_FILENAME_CHARS.sub('_', url)}.html")
             with open(debug_file, 'w', encoding='utf-8') as f:
-                # Write HTML in chunks if it's very large
-                if len(html) > 1024 * 1024:  # 1MB
-                    for i in range(0, len(html), chunk_size):
-                        f.write(html[i:i+chunk_size])
-                else:
-                    f.write(html)
+                f.write(html)
             logger.debug(f"Saved debug HTML to {debug_file}")
         
         # Only cache Google Sheets
         if "docs.google.com/spreadsheets" in url and html:
             with open(GOOGLE_SHEET_CACHE_FILE, 'w', encoding='utf-8') as f:
-                # Write in chunks for large Google Sheets
-                if len(html) > 1024 * 1024:  # 1MB
-                    for i in range(0, len(html), chunk_size):
-                        f.write(html[i:i+chunk_size])
-                else:
-                    f.write(html)
+                f.write(html)
             logger.info(f"Cached Google Sheet HTML to {GOOGLE_SHEET_CACHE_FILE}")
         
-        # Add a small delay to ensure the page has time to render
-        time.sleep(1)
-        
         return html
     except Exception as e:
         # Log error but don't fail completely - some URLs might be temporarily unavailable
@@ -393,8 +476,8 @@ def extract_links(url, limit=1, debug=False):
         # Add original URL to results
         result = [url]
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        # Parse with BeautifulSoup (keep <meta> too - the description tags are read below)
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=DOC_STRAINER)
         
         # Extract links from anchor tags
         doc_links = set()
@@ -458,6 +541,7 @@ def extract_links(url, limit=1, debug=False):
         filtered_links.add(url)
         
         # Include emails and specific content links
+        doc_base_url = url.split('/edit')[0]
         for link in all_links:
             # Keep email links
             if link.startswith('mailto:'):
@@ -475,68 +559,30 @@ def extract_links(url, limit=1, debug=False):
                 continue
                 
             # Check if it's a content link and not an infrastructure link
-            is_infrastructure = any([
-                'gstatic.com' in link,
-                'apis.google.com' in link,
-                'script.google.com' in link,
-                'chrome.google.com' in link,
-                'clients6.google.com' in link,
-                '/static/' in link,
-                'accounts.google.com' in link,
-                'docs.google.com/picker' in link,
-                'docs.google.com/relay.html' in link,
-                'contacts.google.com' in link,
-                'lh7-rt.googleusercontent.com' in link,
-                'googleusercontent.com/docs' in link,
-                'schema.org' in link,
-                'w3.org' in link,
-                '#' in link,
-                link.endswith('.js'),
-                link.endswith('.css'),
-                link.endswith('.png'),
-                link.endswith('.gif'),
-                'docs.google.com/static' in link,
-                'docs.google.com/preview' in link,
-                'docs.google.com?usp=' in link,
-                '",s-blob-v1-IMAGE-' in link,
-                '"' in link,
-                'support.google.com' in link,
-                "}.config['csfu']" in link
-            ])
+            is_infrastructure = (
+                any(marker in link for marker in INFRASTRUCTURE_LINK_MARKERS)
+                or link.endswith(INFRASTRUCTURE_LINK_SUFFIXES)
+            )
             
             if not is_infrastructure:
                 # Clean up URL if needed (remove trailing quotes or parentheses, etc.)
                 link = re.sub(r'[\"\'\)]$', '', link)
                 
                 # Skip links that have JSON/code markers or font references
-                if any([
-                    '{' in link,
-                    '}' in link,
-                    '[' in link,
-                    ']' in link,
-                    'si:' in link,
-                    'ei:' in link,
-                    'sm:' in link,
-                    'spi:' in link,
-                    'docs/fonts' in link,
-                    '.woff' in link
-                ]):
+                if any(marker in link for marker in CODE_LINK_MARKERS):
                     continue
                     
                 # Skip Google Doc internal links that aren't really content
                 if link.startswith('https://docs.google.com') and link != url:
-                    if any([
-                        'usp\u003d' in link,
-                        '/preview' in link,
-                        '/edit?' in link and url.split('/edit')[0] in link
-                    ]):
+                    if ('usp\u003d' in link or
+                        '/preview' in link or
+                        ('/edit?' in link and doc_base_url in link)):
                         continue
                 
                 filtered_links.add(link)
         
-        # Remove duplicates and return
-        result = list(filtered_links)
-        return result[:limit] if limit > 0 else result
+        # Take only the first `limit` links without materializing the whole set
+        return _take(filtered_links, limit)
     
     # Regular drive.google.com links
     elif "drive.google.com" in url:
@@ -545,7 +591,7 @@ def extract_links(url, limit=1, debug=False):
         result = [url]
         
         # Parse with BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=ANCHOR_STRAINER)
         
         # Extract links from anchor tags
         drive_links = {a.get('href') for a in soup.find_all('a', href=True)}
@@ -560,28 +606,30 @@ def extract_links(url, limit=1, debug=False):
         all_links = {link for link in all_links if link and not link.startswith('javascript:')}
         
         # Add them to result
-        result.extend(all_links)
+        all_links.update(result)
         
         # Remove duplicates and return
-        result = list(set(result))
-        return result[:limit] if limit > 0 else result
+        return _take(all_links, limit)
     
     # For other sites, regular link extraction
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ANCHOR_STRAINER)
     # Get links from anchor tags
     links = {a.get('href') for a in soup.find_all('a', href=True)}
     # Get links appearing in plain text
     text_links = set(re.findall(r'https?://\S+', html))
-    result = list(links.union(text_links))
-    
-    # Filter out empty or None links
-    result = [link for link in result if link]
     
-    # Return only the requested number of links
-    return result[:limit] if limit > 0 else result
+    # Filter out empty or None links; return only the requested number
+    return _take((link for link in links.union(text_links) if link), limit)
+
+
+def _take(links, limit):
+    """Return the first `limit` links (all if limit <= 0) without building a full list first"""
+    if limit > 0:
+        return list(islice(links, limit))
+    return list(links)
 
 
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 
 def extract_drive_links_from_html(html):
     """Extract Google Drive links directly from HTML content"""
@@ -687,7 +735,7 @@ def extract_youtube_playlists(links):
             if not link.startswith('http'):
                 continue
                 
-            parsed = urlparse(link)
+            parsed = urlsplit(link)
             if "youtube.com" in parsed.netloc and "/playlist" in parsed.path:
                 qs = parse_qs(parsed.query)
                 if "list" in qs and qs["list"]:
@@ -712,6 +760,56 @@ def build_youtube_playlist_url(yt_ids):
         return URLPatterns.YOUTUBE_WATCH_VIDEOS + ",".join(yt_ids)
     return None
 
+def scan_links(links):
+    """Classify links in a single pass.
+    
+    Fuses the work of extract_youtube_playlists, extract_youtube_ids and the
+    link half of extract_drive_links so process_url walks the list once.
+    
+    Args:
+        links: List of URLs to classify
+        
+    Returns:
+        tuple: (playlist URLs, YouTube video IDs, Google Drive URLs)
+    """
+    # DRY CONSOLIDATION - Step 2: Use centralized YouTube ID extraction
+    try:
+        from .patterns import extract_youtube_id
+    except ImportError:
+        from patterns import extract_youtube_id
+    
+    playlists = {}
+    yt_ids = {}
+    drive_urls = []
+    
+    for link in links:
+        try:
+            # Skip non-URL links like mailto: or invalid URLs
+            if not link.startswith('http'):
+                continue
+            
+            if ('drive.google.com/file/d/' in link or
+                'drive.google.com/open?id=' in link or
+                'drive.google.com/drive/folders/' in link):
+                drive_urls.append(link)
+                continue
+            
+            if "youtube.com" in link and "/playlist" in link:
+                parsed = urlsplit(link)
+                if "youtube.com" in parsed.netloc and "/playlist" in parsed.path:
+                    qs = parse_qs(parsed.query)
+                    if qs.get("list"):
+                        playlists[f"https://www.youtube.com/playlist?list={qs['list'][0]}"] = None
+            
+            video_id = extract_youtube_id(link)
+            if video_id:
+                yt_ids[video_id] = None
+        except Exception as e:
+            logger.error(f"Error parsing link {link}: {str(e)}")
+            continue
+    
+    return list(playlists), list(yt_ids), drive_urls
+
 def process_url(url, limit=1, debug=False):
     """
     Process a URL to extract links, YouTube playlists, and Google Drive links.
@@ -742,19 +840,20 @@ def process_url(url, limit=1, debug=False):
     
     # Process links to extract YouTube content and Drive links
     if links:
-        # First check for actual YouTube playlists
-        youtube_playlists = extract_youtube_playlists(links)
+        # One pass over the links for playlists, video IDs and Drive URLs
+        youtube_playlists, yt_ids, drive_links = scan_links(links)
         
         if youtube_playlists:
             # If we found actual playlists, use them (join with | for multiple)
             yt_playlist_url = "|".join(youtube_playlists)
         else:
             # Fall back to synthetic playlist from individual videos
-            yt_ids = extract_youtube_ids(links)
             yt_playlist_url = build_youtube_playlist_url(yt_ids)
         
-        # Extract Drive links from both regular links and HTML content
-        drive_links = extract_drive_links(links, html=html)
+        # Add Drive links found directly in the HTML content
+        if html:
+            seen_drive = set(drive_links)
+            drive_links.extend(link for link in extract_drive_links_from_html(html) if link not in seen_drive)
         
         # Return None for empty values
         if not yt_playlist_url:
@@ -789,8 +888,9 @@ def process_url(url, limit=1, debug=False):
 import subprocess
 import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
@@ -813,25 +913,13 @@ class SeleniumExtractionStrategy(ExtractionStrategy):
         """Extract content using Selenium WebDriver"""
         logger.info(f"Using Selenium strategy for: {url}")
         
-        # Enhanced Chrome options for root user (from extract_single_doc.py)
-        chrome_options = Options()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-setuid-sandbox")
-        chrome_options.add_argument("--user-data-dir=/tmp/chrome-user-data")
-        chrome_options.add_argument("--data-path=/tmp/chrome-data")
-        chrome_options.add_argument("--disk-cache-dir=/tmp/chrome-cache")
-        chrome_options.add_argument("--homedir=/tmp")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
         try:
-            # DRY CONSOLIDATION: Use centralized Selenium driver
+            # DRY CONSOLIDATION: Use centralized Selenium driver (built once with the
+            # shared get_chrome_options(); reused across documents, quit at exit)
             driver = get_selenium_driver()
+            if driver is None:
+                logger.error("Failed to initialize Selenium driver")
+                return ""
             logger.info("Loading document...")
             driver.get(url)
             
@@ -862,7 +950,6 @@ class SeleniumExtractionStrategy(ExtractionStrategy):
                 except Exception:
                     continue
             
-            driver.quit()
             return content
             
         except Exception as e:
@@ -872,6 +959,33 @@ class SeleniumExtractionStrategy(ExtractionStrategy):
 class HttpExtractionStrategy(ExtractionStrategy):
     """HTTP requests-based extraction strategy (consolidates extract_doc_simple.py)"""
     
+    def __init__(self):
+        self._session = None
+    
+    def _get_session(self) -> requests.Session:
+        """Lazily create one keep-alive session reused for every URL variant and call"""
+        if self._session is None:
+            session = requests.Session()
+            # DRY CONSOLIDATION - Step 5: Use centralized HTTP header configuration
+            session.headers['User-Agent'] = config.get('web_scraping.user_agent',
+                                                       'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+            # Pool sized for the concurrent URL variants; transient errors are
+            # retried on the open connection instead of failing the variant
+            retry = Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          allowed_methods=frozenset(['GET', 'HEAD']))
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+    
+    def close(self):
+        """Release pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
     def extract_content(self, url: str) -> str:
         """Extract content using HTTP requests"""
         logger.info(f"Using HTTP strategy for: {url}")
@@ -892,55 +1006,62 @@ class HttpExtractionStrategy(ExtractionStrategy):
             url
         ]
         
-        # DRY CONSOLIDATION - Step 5: Use centralized HTTP header configuration
-        from .config import get_config
-        config = get_config()
-        headers = {
-            'User-Agent': config.get('web_scraping.user_agent', 
-                                   'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        }
+        # Fetch every variant concurrently, then keep the first in priority order
+        # that produced substantial content. The session is created up front so
+        # the worker threads share it.
+        self._get_session()
+        with ThreadPoolExecutor(max_workers=len(urls_to_try)) as executor:
+            results = list(executor.map(self._fetch_text, urls_to_try))
         
-        for test_url in urls_to_try:
-            try:
-                logger.debug(f"Trying URL: {test_url}")
-                response = requests.get(test_url, headers=headers, timeout=30)
-                
-                if response.status_code == 200:
-                    # Extract text content
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Remove script and style elements
-                    for script in soup(["script", "style"]):
-                        script.decompose()
-                    
-                    # Get text and clean up
-                    text = soup.get_text()
-                    lines = (line.strip() for line in text.splitlines())
-                    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                    text = ' '.join(chunk for chunk in chunks if chunk)
-                    
-                    if len(text.strip()) > 100:  # Only return if we got substantial content
-                        logger.info(f"HTTP extraction successful: {len(text)} characters")
-                        return text
-                        
-            except Exception as e:
-                logger.debug(f"HTTP attempt failed for {test_url}: {str(e)}")
-                continue
+        for text in results:
+            if len(text.strip()) > 100:  # Only return if we got substantial content
+                logger.info(f"HTTP extraction successful: {len(text)} characters")
+                return text
         
         logger.warning("All HTTP extraction attempts failed")
         return ""
+    
+    def _fetch_text(self, test_url: str) -> str:
+        """Fetch one URL variant and return its cleaned text, or "" on failure"""
+        try:
+            logger.debug(f"Trying URL: {test_url}")
+            response = self._get_session().get(test_url, timeout=30)
+            
+            if response.status_code != 200:
+                return ""
+            
+            # Extract text content
+            soup = BeautifulSoup(response.text, HTML_PARSER)
+            
+            # Remove script and style elements
+            for script in soup(["script", "style"]):
+                script.decompose()
+            
+            # Get text and clean up
+            text = soup.get_text()
+            lines = (line.strip() for line in text.splitlines())
+            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+            return ' '.join(chunk for chunk in chunks if chunk)
+            
+        except Exception as e:
+            logger.debug(f"HTTP attempt failed for {test_url}: {str(e)}")
+            return ""
 
 class ChromiumExtractionStrategy(ExtractionStrategy):
     """Chromium subprocess-based extraction strategy (consolidates extract_chromium.py)"""
     
+    _available = None  # Probed once per process
+    
     def is_suitable_for(self, url: str) -> bool:
         """Check if Chromium is available on the system"""
-        try:
-            subprocess.run(['/usr/bin/chromium-browser', '--version'], 
-                         capture_output=True, timeout=5)
-            return True
-        except Exception:
-            return False
+        if ChromiumExtractionStrategy._available is None:
+            try:
+                subprocess.run(['/usr/bin/chromium-browser', '--version'], 
+                             capture_output=True, timeout=5)
+                ChromiumExtractionStrategy._available = True
+            except Exception:
+                ChromiumExtractionStrategy._available = False
+        return ChromiumExtractionStrategy._available
     
     def extract_content(self, url: str) -> str:
         """Extract content using Chromium subprocess"""
@@ -967,7 +1088,7 @@ class ChromiumExtractionStrategy(ExtractionStrategy):
             if result.returncode == 0:
                 # Extract text from HTML
                 html_content = result.stdout
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = BeautifulSoup(html_content, HTML_PARSER)
                 
                 # Remove script and style elements
                 for script in soup(["script", "style"]):
@@ -992,25 +1113,21 @@ class ExtractionContext:
     """Context class that manages extraction strategies"""
     
     def __init__(self):
-        self.strategies = [
-            SeleniumExtractionStrategy(),
-            HttpExtractionStrategy(),
-            ChromiumExtractionStrategy()
-        ]
+        # Built once and shared by named and auto-selected lookups
+        self.strategy_map = {
+            'selenium': SeleniumExtractionStrategy(),
+            'http': HttpExtractionStrategy(),
+            'chromium': ChromiumExtractionStrategy()
+        }
+        self.strategies = list(self.strategy_map.values())
     
     def extract_with_strategy(self, url: str, strategy_name: str = None) -> str:
         """Extract content using a specific strategy or auto-select best one"""
         
         if strategy_name:
             # Use specified strategy
-            strategy_map = {
-                'selenium': SeleniumExtractionStrategy(),
-                'http': HttpExtractionStrategy(), 
-                'chromium': ChromiumExtractionStrategy()
-            }
-            
-            if strategy_name in strategy_map:
-                strategy = strategy_map[strategy_name]
+            strategy = self.strategy_map.get(strategy_name)
+            if strategy is not None:
                 if strategy.is_suitable_for(url):
                     return strategy.extract_content(url)
                 else:
@@ -5,9 +5,13 @@ Consolidates scattered regex patterns throughout the codebase for consistency
 Also includes Selenium helpers for consistent web automation
 """
 
+import os
 import re
+import shutil
+import sys
+import tempfile
 import time
-from typing import Pattern, Dict, List
+from typing import Pattern, Dict, Tuple
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -144,6 +148,19 @@ MEDIA_EXTENSIONS = {
     'data': ['.csv', '.json', '.xml', '.xlsx', '.xls']
 }
 
+# Reverse lookup built once at import: extension -> file type
+EXTENSION_TO_TYPE = {
+    sys.intern(ext): file_type
+    for file_type, extensions in MEDIA_EXTENSIONS.items()
+    for ext in extensions
+}
+
+# Immutable per-type extension tuples, shared by every get_file_extensions_by_type call
+_EXTENSIONS_BY_TYPE = {file_type: tuple(extensions) for file_type, extensions in MEDIA_EXTENSIONS.items()}
+
+# Extensions counted as media by is_media_file
+MEDIA_FILE_EXTENSIONS = frozenset(MEDIA_EXTENSIONS['video'] + MEDIA_EXTENSIONS['audio'])
+
 def get_file_type(filename: str) -> str:
     """
     Standardized file type detection (DRY consolidation).
@@ -154,22 +171,20 @@ def get_file_type(filename: str) -> str:
     Returns:
         File type category ('video', 'audio', 'image', 'document', 'archive', 'data', 'unknown')
     """
-    from pathlib import Path
-    ext = Path(filename).suffix.lower()
-    
-    for file_type, extensions in MEDIA_EXTENSIONS.items():
-        if ext in extensions:
-            return file_type
-    return 'unknown'
+    ext = os.path.splitext(filename)[1].lower()
+    return EXTENSION_TO_TYPE.get(ext, 'unknown')
 
 def is_media_file(filename: str) -> bool:
     """Check if file is a media file (video or audio)"""
-    file_type = get_file_type(filename)
-    return file_type in ['video', 'audio']
+    return os.path.splitext(filename)[1].lower() in MEDIA_FILE_EXTENSIONS
 
-def get_file_extensions_by_type(file_type: str) -> List[str]:
-    """Get list of extensions for a specific file type"""
-    return MEDIA_EXTENSIONS.get(file_type, [])
+def get_file_extensions_by_type(file_type: str) -> Tuple[str, ...]:
+    """Get extensions for a specific file type (cached tuple - no per-call allocation)
+    
+    Returns a tuple rather than a list (changed from earlier versions) so callers
+    can't mutate the shared registry; wrap in list() if you need to modify it.
+    """
+    return _EXTENSIONS_BY_TYPE.get(file_type, ())
 
 def clean_url(url: str) -> str:
     """Clean URL using centralized patterns"""
@@ -198,6 +213,14 @@ def is_drive_url(url: str) -> bool:
 
 
 # Selenium helper functions (DRY)
+
+# Chrome's disk cache is throwaway scratch - keep it in RAM when a writable tmpfs exists
+CHROME_CACHE_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else "/tmp"
+# Cap the cache so a RAM-backed /dev/shm (64MB in default Docker) can't fill up
+CHROME_DISK_CACHE_BYTES = 16 * 1024 * 1024
+# Per-options scratch dirs, removed by cleanup_selenium_driver once Chrome has quit
+_chrome_scratch_dirs = []
+
 def get_chrome_options() -> Options:
     """Get standardized Chrome options for Selenium WebDriver (DRY)"""
     chrome_options = Options()
@@ -215,9 +238,6 @@ def get_chrome_options() -> Options:
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     
     # Use temporary directory in /tmp for Chrome user data
-    import tempfile
-    import os
-    
     # Handle running as root/sudo by setting HOME to /tmp
     if os.geteuid() == 0:  # Running as root
         os.environ['HOME'] = '/tmp'
@@ -225,10 +245,17 @@ def get_chrome_options() -> Options:
     temp_dir = tempfile.mkdtemp(prefix="chrome_temp_", dir="/tmp")
     # Ensure directory has proper permissions
     os.chmod(temp_dir, 0o755)
+    # Profile dirs are per-options and were never removed; delete them after quit()
+    _chrome_scratch_dirs.append(temp_dir)
     
     chrome_options.add_argument(f"--user-data-dir={temp_dir}")
     chrome_options.add_argument(f"--crash-dumps-dir={temp_dir}")
     
+    cache_dir = tempfile.mkdtemp(prefix="chrome_cache_", dir=CHROME_CACHE_ROOT)
+    _chrome_scratch_dirs.append(cache_dir)
+    chrome_options.add_argument(f"--disk-cache-dir={cache_dir}")
+    chrome_options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_BYTES}")
+    
     # Try to find Chrome binary
     chrome_paths = [
         "/usr/bin/google-chrome",
@@ -284,6 +311,7 @@ def wait_and_scroll_page(driver, wait_timeout: int = 30, scroll_delay: float = 0
 
 # Global selenium driver with enhanced management
 import atexit
+from functools import lru_cache
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 
@@ -315,6 +343,15 @@ except ImportError:
 
 _driver = None
 
+@lru_cache(maxsize=1)
+def _chromedriver_path():
+    """Resolve chromedriver via webdriver_manager once per process.
+    
+    install() checks the installed Chrome version and the driver cache on every
+    call, which otherwise repeats on each driver (re)initialization.
+    """
+    return ChromeDriverManager().install()
+
 @with_standard_error_handling("Selenium driver initialization", None)
 def get_selenium_driver():
     """Get initialized Selenium WebDriver with standardized options and enhanced error handling (DRY)"""
@@ -330,7 +367,7 @@ def get_selenium_driver():
             if HAS_WEBDRIVER_MANAGER:
                 # Try with webdriver_manager if available
                 try:
-                    _driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+                    _driver = webdriver.Chrome(service=Service(_chromedriver_path()), options=chrome_options)
                 except Exception as e2:
                     logger.error(f"Error with webdriver_manager: {str(e2)}")
                     _driver = None
@@ -339,6 +376,10 @@ def get_selenium_driver():
                 logger.error("Install chromedriver and ensure it's in PATH, or install webdriver-manager")
                 _driver = None
     
+        if _driver is None:
+            # Initialization failed - don't retry it via the liveness check below
+            return None
+    
     # Ensure driver is still alive
     try:
         _driver.title  # Simple check to see if driver is responsive
@@ -360,6 +401,12 @@ def cleanup_selenium_driver():
             logger.info("Selenium driver cleaned up successfully")
         except Exception as e:
             logger.error(f"Error cleaning up Selenium driver: {e}")
+            # Chrome may still be running - leave its profile and tmpfs cache dirs in place
+            return
+    
+    # Only safe once Chrome has exited (quit() succeeded or no driver was started)
+    while _chrome_scratch_dirs:
+        shutil.rmtree(_chrome_scratch_dirs.pop(), ignore_errors=True)
 
 # Register cleanup function to run on exit
 atexit.register(cleanup_selenium_driver)
@@ -579,6 +626,98 @@ def extract_all_urls_from_text(text: str) -> Dict[str, list]:
     return result
 
 
+# Common noise patterns excluded by filter_meaningful_urls (all lowercase)
+DEFAULT_URL_EXCLUDE_PATTERNS = (
+    'accounts.google.com',
+    'login',
+    'signin',
+    'error',
+    '404',
+    'redirect',
+    'auth',
+    'oauth',
+    'support.google.com',
+    'policies.google.com',
+    'privacy',
+    'terms',
+    'help',
+    'about',
+    'contact',
+    'feedback',
+    'report',
+    'abuse',
+    'developers.google.com',
+    'cloud.google.com',
+    'workspace.google.com',
+    'gsuite.google.com',
+    'admin.google.com',
+    'myaccount.google.com',
+    'google.com/search',
+    'google.com/intl',
+    'google.com/policies',
+    'google.com/chrome',
+    'google.com/gmail',
+    'google.com/maps',
+    'google.com/news',
+    'google.com/shopping',
+    'google.com/images',
+    'google.com/translate',
+    'google.com/calendar',
+    'google.com/drive/help',
+    'google.com/drive/apps',
+    'docs.google.com/document/u/0',
+    'docs.google.com/spreadsheets/u/0',
+    'docs.google.com/presentation/u/0',
+    'docs.google.com/forms/u/0',
+    'drive.google.com/drive/u/0',
+    'drive.google.com/drive/my-drive',
+    'drive.google.com/drive/shared-with-me',
+    'drive.google.com/drive/recent',
+    'drive.google.com/drive/starred',
+    'drive.google.com/drive/trash',
+    'drive.google.com/drive/activity',
+    'drive.google.com/drive/settings',
+    'www.youtube.com/feed',
+    'www.youtube.com/channel',
+    'www.youtube.com/user',
+    'www.youtube.com/results',
+    'www.youtube.com/playlist',
+    'music.youtube.com',
+    'youtube.com/shorts',
+    'youtube.com/live',
+    'youtube.com/gaming',
+    'youtube.com/trending',
+    'youtube.com/subscriptions',
+    'youtube.com/history',
+    'youtube.com/library',
+    'youtube.com/account',
+    'youtube.com/upload',
+    'youtube.com/create',
+    'youtube.com/studio',
+    'youtube.com/analytics',
+    'youtube.com/ads',
+    'youtube.com/premium',
+    'youtube.com/music',
+    'youtube.com/tv',
+    'youtube.com/kids',
+    'youtube.com/howyoutubeworks',
+    'youtube.com/about',
+    'youtube.com/press',
+    'youtube.com/copyright',
+    'youtube.com/policies',
+    'youtube.com/safety',
+    'youtube.com/creators',
+    'youtube.com/advertise',
+    'youtube.com/developer',
+    'youtube.com/terms',
+    'youtube.com/privacy',
+    'youtube.com/community',
+    'youtube.com/intl',
+)
+# One alternation scan per URL instead of a substring search per pattern
+DEFAULT_URL_EXCLUDE_RE = re.compile('|'.join(map(re.escape, DEFAULT_URL_EXCLUDE_PATTERNS)))
+
+
 def filter_meaningful_urls(urls: list, exclude_patterns: list = None) -> list:
     """
     Filter URLs to remove noise and infrastructure links.
@@ -596,108 +735,20 @@ def filter_meaningful_urls(urls: list, exclude_patterns: list = None) -> list:
         meaningful_urls = filter_meaningful_urls(all_urls)
         # Removes things like login pages, error pages, etc.
     """
-    if exclude_patterns is None:
-        exclude_patterns = []
-    
-    # Common noise patterns to exclude
-    default_exclude_patterns = [
-        'accounts.google.com',
-        'login',
-        'signin',
-        'error',
-        '404',
-        'redirect',
-        'auth',
-        'oauth',
-        'support.google.com',
-        'policies.google.com',
-        'privacy',
-        'terms',
-        'help',
-        'about',
-        'contact',
-        'feedback',
-        'report',
-        'abuse',
-        'developers.google.com',
-        'cloud.google.com',
-        'workspace.google.com',
-        'gsuite.google.com',
-        'admin.google.com',
-        'myaccount.google.com',
-        'google.com/search',
-        'google.com/intl',
-        'google.com/policies',
-        'google.com/chrome',
-        'google.com/gmail',
-        'google.com/maps',
-        'google.com/news',
-        'google.com/shopping',
-        'google.com/images',
-        'google.com/translate',
-        'google.com/calendar',
-        'google.com/drive/help',
-        'google.com/drive/apps',
-        'docs.google.com/document/u/0',
-        'docs.google.com/spreadsheets/u/0',
-        'docs.google.com/presentation/u/0',
-        'docs.google.com/forms/u/0',
-        'drive.google.com/drive/u/0',
-        'drive.google.com/drive/my-drive',
-        'drive.google.com/drive/shared-with-me',
-        'drive.google.com/drive/recent',
-        'drive.google.com/drive/starred',
-        'drive.google.com/drive/trash',
-        'drive.google.com/drive/activity',
-        'drive.google.com/drive/settings',
-        'www.youtube.com/feed',
-        'www.youtube.com/channel',
-        'www.youtube.com/user',
-        'www.youtube.com/results',
-        'www.youtube.com/playlist',
-        'music.youtube.com',
-        'youtube.com/shorts',
-        'youtube.com/live',
-        'youtube.com/gaming',
-        'youtube.com/trending',
-        'youtube.com/subscriptions',
-        'youtube.com/history',
-        'youtube.com/library',
-        'youtube.com/account',
-        'youtube.com/upload',
-        'youtube.com/create',
-        'youtube.com/studio',
-        'youtube.com/analytics',
-        'youtube.com/ads',
-        'youtube.com/premium',
-        'youtube.com/music',
-        'youtube.com/tv',
-        'youtube.com/kids',
-        'youtube.com/howyoutubeworks',
-        'youtube.com/about',
-        'youtube.com/press',
-        'youtube.com/copyright',
-        'youtube.com/policies',
-        'youtube.com/safety',
-        'youtube.com/creators',
-        'youtube.com/advertise',
-        'youtube.com/developer',
-        'youtube.com/terms',
-        'youtube.com/privacy',
-        'youtube.com/community',
-        'youtube.com/intl'
-    ]
-    
-    all_exclude_patterns = default_exclude_patterns + exclude_patterns
+    if exclude_patterns:
+        exclude_re = re.compile('|'.join(
+            re.escape(pattern.lower()) for pattern in DEFAULT_URL_EXCLUDE_PATTERNS + tuple(exclude_patterns)
+        ))
+    else:
+        exclude_re = DEFAULT_URL_EXCLUDE_RE
     
     filtered_urls = []
     for url in urls:
-        if not url or url in ['nan', 'None', '']:
+        if not url or url in ('nan', 'None', ''):
             continue
         
         # Check if URL contains any exclude pattern
-        url_lower = url.lower()
-        if any(pattern.lower() in url_lower for pattern in all_exclude_patterns):
+        if exclude_re.search(url.lower()):
             continue
         
         # Additional checks for meaningful content
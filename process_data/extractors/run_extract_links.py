@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 import csv
-import os
 import sys
+from pathlib import Path
 
-# Add utils directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'utils'))
-
-from extract_links import process_url
+# Resolve extract_links normally (script dir / PYTHONPATH); only fall back to mutating sys.path if that fails
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+try:
+    from extract_links import process_url
+except ImportError:
+    if SCRIPT_DIR not in sys.path:
+        sys.path.append(SCRIPT_DIR)
+    from extract_links import process_url
 
 # Get the first N rows from CSV file
 def process_first_n_rows(csv_path, n=5):
@@ -6,7 +6,7 @@ Consolidates URL parsing and processing patterns.
 
 import re
 from typing import Optional, Tuple, List
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 # DRY CONSOLIDATION - Step 2: Import centralized patterns
 from .constants import URLPatterns
 
@@ -29,7 +29,7 @@ def extract_youtube_id(url: str) -> Optional[str]:
     
     # Handle edge cases not covered by main pattern
     # Extract from query parameters for complex URLs
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
     if parsed.hostname and 'youtube' in parsed.hostname:
         query_params = parse_qs(parsed.query)
         if 'v' in query_params:
@@ -60,7 +60,7 @@ def extract_drive_id(url: str) -> Optional[str]:
         return folder_match.group(1)
     
     # Handle edge cases with query parameters
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
     if parsed.hostname and 'drive' in parsed.hostname:
         query_params = parse_qs(parsed.query)
         if 'id' in query_params:
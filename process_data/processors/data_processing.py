@@ -12,6 +12,8 @@ Consolidates common data processing patterns found across the codebase:
 
 import os
 import json
+import time
+import tracemalloc
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -19,6 +21,7 @@ from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 from datetime import datetime
 import re
 from functools import wraps
+from concurrent.futures import ProcessPoolExecutor
 
 # Standardized project imports
 from utils.config import setup_project_imports
@@ -30,6 +33,12 @@ from utils.config import get_csv_config, ensure_parent_dir, get_csv_delimiter
 
 logger = get_logger(__name__)
 
+# Optional fast JSON backend (C extension); stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # CSV PROCESSING UTILITIES
@@ -303,6 +312,31 @@ def join_values_to_column(values: List[str],
 # JSON PROCESSING UTILITIES
 # ============================================================================
 
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    orjson rejects the NaN/Infinity tokens stdlib json writes, so anything it
+    refuses is re-parsed with stdlib json and the result never depends on
+    whether orjson is available.
+    
+    Args:
+        data: JSON text or UTF-8 bytes
+        
+    Returns:
+        Parsed JSON value
+        
+    Example:
+        metadata = loads_json(response['Body'].read())
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 @handle_file_operations("read_json_safe", return_on_error={})
 def read_json_safe(file_path: Union[str, Path], 
                    default: Any = None,
@@ -330,6 +364,8 @@ def read_json_safe(file_path: Union[str, Path],
         return default if default is not None else {}
     
     try:
+        if encoding.lower().replace('-', '') == 'utf8':
+            return loads_json(file_path.read_bytes())
         with open(file_path, 'r', encoding=encoding) as f:
             return json.load(f)
     except json.JSONDecodeError as e:
@@ -367,7 +403,7 @@ def write_json_safe(data: Any,
     ensure_parent_dir(file_path, logger=logger)
     
     with open(file_path, 'w', encoding=encoding) as f:
-        json.dump(data, f, indent=indent, sort_keys=sort_keys, default=str)
+        f.write(json.dumps(data, indent=indent, sort_keys=sort_keys, default=str))
     
     logger.info(f"Successfully wrote JSON: {file_path}")
     return True
@@ -410,6 +446,9 @@ def merge_json_configs(base_config: Dict[str, Any],
 # DATA CLEANING UTILITIES
 # ============================================================================
 
+# Email format accepted by normalize_email_column
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def clean_string_column(series: pd.Series, 
                        strip: bool = True,
                        lower: bool = False,
@@ -469,18 +508,12 @@ def normalize_email_column(series: pd.Series) -> pd.Series:
     Example:
         df['email'] = normalize_email_column(df['email'])
     """
-    # Clean and normalize
-    series = clean_string_column(series, lower=True, strip=True)
-    
-    # Validate email format
-    email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    # Clean and normalize; an all-blank column comes back as float64 NaN, which
+    # the .str accessor rejects, so force object dtype first
+    series = clean_string_column(series, lower=True, strip=True).astype(object)
     
-    def validate_email(email):
-        if pd.isna(email) or not email:
-            return np.nan
-        return email if email_pattern.match(email) else np.nan
-    
-    return series.apply(validate_email)
+    # Validate email format in one vectorized pass; nulls and mismatches become NaN
+    return series.where(series.str.match(EMAIL_PATTERN, na=False))
 
 
 def remove_duplicates_preserve_order(items: List[Any]) -> List[Any]:
@@ -771,8 +804,9 @@ def generate_summary_stats(df: pd.DataFrame,
     if columns is None:
         columns = df.columns.tolist()
     
+    total_rows = len(df)
     stats = {
-        'total_rows': len(df),
+        'total_rows': total_rows,
         'columns': {}
     }
     
@@ -780,20 +814,37 @@ def generate_summary_stats(df: pd.DataFrame,
         if col not in df.columns:
             continue
         
+        # Empty frame: nothing to scan, skip the per-column reductions
+        if total_rows == 0:
+            stats['columns'][col] = {
+                'non_null_count': 0,
+                'null_count': 0,
+                'unique_count': 0,
+                'null_percentage': 0
+            }
+            continue
+        
+        series = df[col]
+        null_count = int(series.isna().sum())
         col_stats = {
-            'non_null_count': df[col].notna().sum(),
-            'null_count': df[col].isna().sum(),
-            'unique_count': df[col].nunique(),
-            'null_percentage': (df[col].isna().sum() / len(df) * 100) if len(df) > 0 else 0
+            'non_null_count': total_rows - null_count,
+            'null_count': null_count,
+            'unique_count': series.nunique(),
+            'null_percentage': null_count / total_rows * 100
         }
         
-        # Add type-specific stats
-        if pd.api.types.is_numeric_dtype(df[col]):
+        # Add type-specific stats (median and tail percentiles from one quantile pass)
+        if pd.api.types.is_numeric_dtype(series):
+            # quantile can't interpolate booleans; treat them as 0/1 like median() did
+            numeric = series.astype(float) if pd.api.types.is_bool_dtype(series) else series
+            quantiles = numeric.quantile([0.5, 0.95, 0.99])
             col_stats.update({
-                'mean': df[col].mean(),
-                'median': df[col].median(),
-                'min': df[col].min(),
-                'max': df[col].max()
+                'mean': series.mean(),
+                'median': quantiles[0.5],
+                'p95': quantiles[0.95],
+                'p99': quantiles[0.99],
+                'min': series.min(),
+                'max': series.max()
             })
         
         stats['columns'][col] = col_stats
@@ -828,26 +879,29 @@ def create_completion_report(df: pd.DataFrame,
         'by_column': {}
     }
     
-    # Check each row for completeness
-    for idx, row in df.iterrows():
-        filled_columns = sum(1 for col in url_columns if pd.notna(row.get(col)) and str(row.get(col)).strip())
-        
-        if filled_columns == len(url_columns):
-            report['summary']['complete_rows'] += 1
-        elif filled_columns > 0:
-            report['summary']['partial_rows'] += 1
-        else:
-            report['summary']['empty_rows'] += 1
-    
-    # Column-specific stats
+    # Count filled URL columns per row in one vectorized pass (missing columns count as empty).
+    # Each column's notna mask is built once and reused for the per-column stats below.
+    total_rows = len(df)
+    filled_columns = pd.Series(0, index=df.index)
     for col in url_columns:
         if col in df.columns:
+            values = df[col]
+            not_null = values.notna()
+            filled_columns += (not_null & (values.astype(str).str.strip() != '')).astype(int)
+            
+            filled = int(not_null.sum())
             report['by_column'][col] = {
-                'filled': df[col].notna().sum(),
-                'empty': df[col].isna().sum(),
-                'percentage': (df[col].notna().sum() / len(df) * 100) if len(df) > 0 else 0
+                'filled': filled,
+                'empty': total_rows - filled,
+                'percentage': (filled / total_rows * 100) if total_rows > 0 else 0
             }
     
+    complete_rows = int((filled_columns == len(url_columns)).sum())
+    empty_rows = int((filled_columns == 0).sum()) if url_columns else 0
+    report['summary']['complete_rows'] = complete_rows
+    report['summary']['empty_rows'] = empty_rows
+    report['summary']['partial_rows'] = total_rows - complete_rows - empty_rows
+    
     return report
 
 
@@ -898,15 +952,15 @@ def with_progress_tracking(task_name: str):
         @wraps(func)
         def wrapper(*args, **kwargs):
             logger.info(f"Starting {task_name}...")
-            start_time = datetime.now()
+            start_time = time.perf_counter()  # Monotonic; no wall-clock syscall + datetime alloc
             
             try:
                 result = func(*args, **kwargs)
-                elapsed = (datetime.now() - start_time).total_seconds()
+                elapsed = time.perf_counter() - start_time
                 logger.info(f"Completed {task_name} in {elapsed:.2f} seconds")
                 return result
             except Exception as e:
-                elapsed = (datetime.now() - start_time).total_seconds()
+                elapsed = time.perf_counter() - start_time
                 logger.error(f"Failed {task_name} after {elapsed:.2f} seconds: {e}")
                 raise
         return wrapper
@@ -932,6 +986,19 @@ if __name__ == "__main__":
 # UNIFIED DATA TRANSFORMATION WORKFLOWS (DRY ITERATION 2 - Step 5)
 # ============================================================================
 
+class PipelineStep:
+    """Single DataTransformationPipeline step with its run counters."""
+    
+    __slots__ = ('function', 'description', 'kwargs', 'applied_count', 'error_count')
+    
+    def __init__(self, function: Callable, description: str, kwargs: Dict[str, Any]):
+        self.function = function
+        self.description = description
+        self.kwargs = kwargs
+        self.applied_count = 0
+        self.error_count = 0
+
+
 class DataTransformationPipeline:
     """
     Unified data transformation pipeline (DRY CONSOLIDATION - Step 5).
@@ -944,8 +1011,14 @@ class DataTransformationPipeline:
     BUSINESS IMPACT: Prevents data corruption and ensures consistent transformations
     """
     
-    def __init__(self, name: str = "default_pipeline"):
+    def __init__(self, name: str = "default_pipeline", clock: Callable[[], datetime] = datetime.now):
+        """
+        Args:
+            name: Pipeline name used in log messages
+            clock: Wall-clock source for start/end timestamps (inject for deterministic tests)
+        """
         self.name = name
+        self._clock = clock
         self.steps = []
         self.logger = get_logger(f"{__name__}.{name}")
         self.stats = {
@@ -958,14 +1031,7 @@ class DataTransformationPipeline:
     
     def add_step(self, func: Callable, description: str = None, **kwargs) -> 'DataTransformationPipeline':
         """Add a transformation step to the pipeline."""
-        step = {
-            'function': func,
-            'description': description or func.__name__,
-            'kwargs': kwargs,
-            'applied_count': 0,
-            'error_count': 0
-        }
-        self.steps.append(step)
+        self.steps.append(PipelineStep(func, description or func.__name__, kwargs))
         return self
     
     def transform(self, data: Union[pd.DataFrame, Dict, List], 
@@ -980,17 +1046,22 @@ class DataTransformationPipeline:
         Returns:
             Transformed data
         """
-        self.stats['start_time'] = datetime.now()
+        self.stats['start_time'] = self._clock()
+        run_start = time.perf_counter()
         self.logger.info(f"🔄 Starting transformation pipeline '{self.name}' with {len(self.steps)} steps")
         
         current_data = data
         total_steps = len(self.steps)
+        # Per-step allocation accounting only when tracing is already on (python -X tracemalloc)
+        tracing = tracemalloc.is_tracing()
         
         for i, step in enumerate(self.steps):
-            step_start = datetime.now()
+            step_start = time.perf_counter()
+            if tracing:
+                mem_before = tracemalloc.get_traced_memory()[0]
             
             try:
-                self.logger.info(f"Step {i+1}/{total_steps}: {step['description']}")
+                self.logger.info(f"Step {i+1}/{total_steps}: {step.description}")
                 
                 # Apply transformation step
                 if isinstance(current_data, pd.DataFrame):
@@ -998,10 +1069,10 @@ class DataTransformationPipeline:
                 else:
                     original_length = len(current_data) if hasattr(current_data, '__len__') else 1
                 
-                current_data = step['function'](current_data, **step['kwargs'])
+                current_data = step.function(current_data, **step.kwargs)
                 
                 # Update statistics
-                step['applied_count'] += 1
+                step.applied_count += 1
                 self.stats['transformations_applied'] += 1
                 
                 if isinstance(current_data, pd.DataFrame):
@@ -1012,21 +1083,24 @@ class DataTransformationPipeline:
                 
                 # Progress callback
                 if progress_callback:
-                    progress_callback(i + 1, total_steps, step['description'])
+                    progress_callback(i + 1, total_steps, step.description)
                 
-                step_duration = (datetime.now() - step_start).total_seconds()
+                step_duration = time.perf_counter() - step_start
                 self.logger.debug(f"  ⏱️ Step duration: {step_duration:.2f}s")
+                if tracing:
+                    mem_delta = tracemalloc.get_traced_memory()[0] - mem_before
+                    self.logger.debug(f"  🧠 Step net allocation: {mem_delta / 1024:.1f} KB")
                 
             except Exception as e:
-                step['error_count'] += 1
+                step.error_count += 1
                 self.stats['errors'] += 1
-                error_msg = f"Step {i+1} failed: {step['description']} - {str(e)}"
+                error_msg = f"Step {i+1} failed: {step.description} - {str(e)}"
                 self.logger.error(error_msg)
                 raise RuntimeError(error_msg)
         
         # Final statistics
-        self.stats['end_time'] = datetime.now()
-        total_duration = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
+        self.stats['end_time'] = self._clock()
+        total_duration = time.perf_counter() - run_start
         
         if isinstance(current_data, pd.DataFrame):
             self.stats['processed_rows'] = len(current_data)
@@ -1114,10 +1188,23 @@ class CSVTransformationWorkflow:
         return df
 
 
+def available_cpu_count() -> int:
+    """
+    Number of CPUs this process is allowed to run on.
+    
+    Honors CPU affinity (taskset, container cpusets) where the platform exposes it,
+    unlike os.cpu_count() which reports every CPU on the host.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 def batch_process_files(file_pattern: str, 
                        transformation_func: Callable,
                        output_pattern: str = None,
-                       progress_callback: Callable = None) -> Dict[str, Any]:
+                       progress_callback: Callable = None,
+                       max_workers: Optional[int] = 1) -> Dict[str, Any]:
     """
     Batch process multiple files with consistent error handling.
     
@@ -1131,6 +1218,10 @@ def batch_process_files(file_pattern: str,
         transformation_func: Function to apply to each file
         output_pattern: Pattern for output files (optional)
         progress_callback: Progress callback function
+        max_workers: Run transformation_func in this many worker processes (CPU-bound
+            transforms on independent files). transformation_func must then be picklable
+            (module-level). Outputs and callbacks still run here, in file order.
+            None uses every CPU this process may run on (see available_cpu_count).
         
     Returns:
         Dictionary with processing results and statistics
@@ -1151,43 +1242,54 @@ def batch_process_files(file_pattern: str,
     
     logger.info(f"🚀 Starting batch processing of {len(files)} files")
     
-    for i, file_path in enumerate(files):
-        try:
-            logger.info(f"📁 Processing file {i+1}/{len(files)}: {Path(file_path).name}")
-            
-            # Apply transformation
-            result = transformation_func(file_path)
-            
-            # Save output if pattern provided
-            if output_pattern:
-                output_path = output_pattern.format(
-                    name=Path(file_path).stem,
-                    timestamp=datetime.now().strftime('%Y%m%d_%H%M%S')
-                )
+    # Independent files: fan transformations out to worker processes when requested
+    if max_workers is None:
+        max_workers = available_cpu_count()
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        futures = [executor.submit(transformation_func, file_path) for file_path in files] if executor else None
+        
+        for i, file_path in enumerate(files):
+            try:
+                logger.info(f"📁 Processing file {i+1}/{len(files)}: {Path(file_path).name}")
                 
-                if hasattr(result, 'to_csv'):
-                    write_csv_safe(result, output_path)
-                elif isinstance(result, dict):
-                    write_json_safe(result, output_path)
-            
-            results['processed_files'].append({
-                'input_file': file_path,
-                'output_file': output_path if output_pattern else None,
-                'success': True
-            })
-            
-            # Progress callback
-            if progress_callback:
-                progress_callback(i + 1, len(files), Path(file_path).name)
+                # Apply transformation
+                result = futures[i].result() if futures else transformation_func(file_path)
                 
-        except Exception as e:
-            error_msg = f"Failed to process {file_path}: {str(e)}"
-            logger.error(error_msg)
+                # Save output if pattern provided
+                if output_pattern:
+                    output_path = output_pattern.format(
+                        name=Path(file_path).stem,
+                        timestamp=datetime.now().strftime('%Y%m%d_%H%M%S')
+                    )
+                    
+                    if hasattr(result, 'to_csv'):
+                        write_csv_safe(result, output_path)
+                    elif isinstance(result, dict):
+                        write_json_safe(result, output_path)
+                
+                results['processed_files'].append({
+                    'input_file': file_path,
+                    'output_file': output_path if output_pattern else None,
+                    'success': True
+                })
+                
+                # Progress callback
+                if progress_callback:
+                    progress_callback(i + 1, len(files), Path(file_path).name)
             
-            results['failed_files'].append({
-                'input_file': file_path,
-                'error': error_msg
-            })
+            except Exception as e:
+                error_msg = f"Failed to process {file_path}: {str(e)}"
+                logger.error(error_msg)
+                
+                results['failed_files'].append({
+                    'input_file': file_path,
+                    'error': error_msg
+                })
+    finally:
+        # Always reap the workers, even on KeyboardInterrupt; drop work not yet started
+        if executor:
+            executor.shutdown(cancel_futures=True)
     
     results['end_time'] = datetime.now()
     duration = (results['end_time'] - results['start_time']).total_seconds()
@@ -1256,8 +1358,9 @@ def aggregate_csv_data(file_paths: List[str],
         )
         
         # Apply aggregation rules for duplicate columns
+        new_columns = []
         for col in df.columns:
-            if col \!= key_column and col in result_df.columns:
+            if col != key_column and col in result_df.columns:
                 new_col = f"{col}_new"
                 if new_col in result_df.columns:
                     rule = aggregation_rules.get(col, 'keep_first')
@@ -1268,11 +1371,14 @@ def aggregate_csv_data(file_paths: List[str],
                         result_df[col] = result_df[new_col].fillna(result_df[col])
                     elif rule == 'combine':
                         # Combine non-null values
-                        mask = result_df[col].isna()  < /dev/null |  (result_df[col] == '')
+                        mask = result_df[col].isna() | (result_df[col] == '')
                         result_df.loc[mask, col] = result_df.loc[mask, new_col]
                     
-                    # Remove the temporary column
-                    result_df = result_df.drop(columns=[new_col])
+                    new_columns.append(new_col)
+        
+        # Remove the temporary columns in one pass (each drop copies the frame)
+        if new_columns:
+            result_df = result_df.drop(columns=new_columns)
     
     logger.info(f"✅ Aggregation complete: {len(result_df)} total rows")
     return result_df
@@ -3,24 +3,90 @@
 Download all Google Drive files and YouTube videos from outputs/output.csv.
 """
 import csv
-import os
 import sys
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Resolve download modules normally (script dir / PYTHONPATH); only fall back to mutating sys.path if that fails
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+try:
+    from download_drive import process_drive_url
+    from download_youtube import download_video
+except ImportError:
+    if SCRIPT_DIR not in sys.path:
+        sys.path.append(SCRIPT_DIR)
+    from download_drive import process_drive_url
+    from download_youtube import download_video
+
+# Values left in link columns by earlier pipeline steps that are not real links
+EMPTY_LINK_MARKERS = frozenset({'-', "'-", 'None', 'nan', ''})
+
+
+def _split_links(value):
+    """Split a pipe-separated link column into real links."""
+    return [link for link in value.split('|') if link not in EMPTY_LINK_MARKERS] if value else []
+
+
+def _download_drive_links(drive_links, delay):
+    """Download a row's Drive files in order. Returns (downloaded, errors)."""
+    downloaded = errors = 0
+    for j, drive_link in enumerate(drive_links):
+        print(f"\nDownloading Drive file {j+1}/{len(drive_links)}: {drive_link}")
+        try:
+            file_path, _ = process_drive_url(drive_link, save_metadata_flag=True)
+            if file_path:
+                downloaded += 1
+                print(f"Successfully downloaded: {file_path}")
+            else:
+                print(f"Failed to download: {drive_link}")
+                errors += 1
+                
+            # Add delay to avoid rate limiting
+            if delay > 0 and j < len(drive_links) - 1:
+                time.sleep(delay)
+        except Exception as e:
+            print(f"Error downloading Drive file: {str(e)}")
+            errors += 1
+    return downloaded, errors
+
+
+def _download_youtube_links(youtube_links, delay, video_resolution):
+    """Download a row's YouTube videos in order. Returns (downloaded, errors)."""
+    downloaded = errors = 0
+    for j, yt_link in enumerate(youtube_links):
+        print(f"\nDownloading YouTube video {j+1}/{len(youtube_links)}: {yt_link}")
+        try:
+            video_file, transcript_file = download_video(
+                yt_link, 
+                transcript_only=False,
+                resolution=video_resolution
+            )
+            if video_file:
+                downloaded += 1
+                print(f"Successfully downloaded: {video_file}")
+            else:
+                print(f"Failed to download video: {yt_link}")
+                errors += 1
+                
+            # Add delay to avoid rate limiting
+            if delay > 0 and j < len(youtube_links) - 1:
+                time.sleep(delay)
+        except Exception as e:
+            print(f"Error downloading YouTube video: {str(e)}")
+            errors += 1
+    return downloaded, errors
 
-# Import download modules
-from download_drive import process_drive_url
-from download_youtube import download_video
 
 def download_all_media(csv_path, start_row=0, max_rows=None, delay=2, 
                       video_resolution="720", skip_existing=True):
     """
     Download all Google Drive files and YouTube videos from the CSV file.
     
+    A row's Drive and YouTube downloads hit different hosts, so they run
+    concurrently; each host's links are still fetched in order with the delay.
+    
     Args:
         csv_path: Path to the CSV file
         start_row: Row number to start processing from (0-based, after header)
@@ -35,7 +101,8 @@ def download_all_media(csv_path, start_row=0, max_rows=None, delay=2,
     youtube_downloaded = 0
     errors = 0
     
-    with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+    with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile, \
+            ThreadPoolExecutor(max_workers=2) as executor:
         reader = csv.DictReader(csvfile)
         
         for i, row in enumerate(reader):
@@ -51,61 +118,31 @@ def download_all_media(csv_path, start_row=0, max_rows=None, delay=2,
             name = row.get('name', f'Row {i+1}')
             print(f"\n{'='*80}\nProcessing row {i+1}: {name}")
             
-            # Download Google Drive files
-            drive_links = row.get('google_drive', '').split('|') if row.get('google_drive') else []
-            drive_links = [link for link in drive_links if link and link not in ['-', "'-", 'None', 'nan', '']]
+            drive_links = _split_links(row.get('google_drive'))
+            youtube_links = _split_links(row.get('youtube_playlist'))
             
             if drive_links:
                 print(f"Found {len(drive_links)} Google Drive links")
-                for j, drive_link in enumerate(drive_links):
-                    print(f"\nDownloading Drive file {j+1}/{len(drive_links)}: {drive_link}")
-                    try:
-                        file_path, _ = process_drive_url(drive_link, save_metadata_flag=True)
-                        if file_path:
-                            drive_downloaded += 1
-                            print(f"Successfully downloaded: {file_path}")
-                        else:
-                            print(f"Failed to download: {drive_link}")
-                            errors += 1
-                            
-                        # Add delay to avoid rate limiting
-                        if delay > 0 and j < len(drive_links) - 1:
-                            time.sleep(delay)
-                    except Exception as e:
-                        print(f"Error downloading Drive file: {str(e)}")
-                        errors += 1
+                drive_future = executor.submit(_download_drive_links, drive_links, delay)
             else:
                 print("No Google Drive links found")
+                drive_future = None
                 
-            # Download YouTube videos
-            youtube_links = row.get('youtube_playlist', '').split('|') if row.get('youtube_playlist') else []
-            youtube_links = [link for link in youtube_links if link and link not in ['-', "'-", 'None', 'nan', '']]
-            
             if youtube_links:
-                print(f"\nFound {len(youtube_links)} YouTube links")
-                for j, yt_link in enumerate(youtube_links):
-                    print(f"\nDownloading YouTube video {j+1}/{len(youtube_links)}: {yt_link}")
-                    try:
-                        video_file, transcript_file = download_video(
-                            yt_link, 
-                            transcript_only=False,
-                            resolution=video_resolution
-                        )
-                        if video_file:
-                            youtube_downloaded += 1
-                            print(f"Successfully downloaded: {video_file}")
-                        else:
-                            print(f"Failed to download video: {yt_link}")
-                            errors += 1
-                            
-                        # Add delay to avoid rate limiting
-                        if delay > 0 and j < len(youtube_links) - 1:
-                            time.sleep(delay)
-                    except Exception as e:
-                        print(f"Error downloading YouTube video: {str(e)}")
-                        errors += 1
+                print(f"Found {len(youtube_links)} YouTube links")
+                youtube_future = executor.submit(_download_youtube_links, youtube_links, delay, video_resolution)
             else:
                 print("No YouTube links found")
+                youtube_future = None
+            
+            if drive_future is not None:
+                downloaded, failed = drive_future.result()
+                drive_downloaded += downloaded
+                errors += failed
+            if youtube_future is not None:
+                downloaded, failed = youtube_future.result()
+                youtube_downloaded += downloaded
+                errors += failed
                 
             processed += 1
             print(f"Completed row {i+1}")
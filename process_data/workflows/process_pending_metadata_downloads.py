@@ -15,7 +15,11 @@ import argparse
 import json
 import logging
 import os
+import re
+import shutil
+import subprocess
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -25,9 +29,11 @@ import traceback
 from utils.config import setup_project_imports
 setup_project_imports()
 
-from utils.s3_manager import UnifiedS3Manager
+from utils.s3_manager import UnifiedS3Manager, get_s3_client
+from utils.path_utils import create_download_path, extract_extension
 from utils.downloader import UnifiedDownloader, DownloadStrategy, DownloadConfig
 from utils.csv_manager import CSVManager
+from utils.data_processing import loads_json
 from utils.row_context import RowContext
 from utils.logging_config import get_logger, print_section_header
 # Setup logging
@@ -36,18 +42,29 @@ logger = get_logger(__name__)
 # Progress tracking file
 PROGRESS_FILE = "metadata_download_progress.json"
 
+# Playlist ID in a YouTube playlist URL
+PLAYLIST_ID_RE = re.compile(r'list=([a-zA-Z0-9_-]+)')
+
+# Drive metadata types handled by UnifiedDownloader.save_drive_info -> log label
+DRIVE_METADATA_LABELS = {
+    'drive_file': 'Drive file',
+    'drive_folder': 'Drive folder',
+}
+
 class MetadataDownloadProcessor:
     """Process metadata files from S3 and download missing media."""
     
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
         # DRY CONSOLIDATION: Use centralized S3 client
-        from utils.s3_manager import get_s3_client
         self.s3_client = get_s3_client()
         self.bucket_name = 'typing-clients-uuid-system'
         self.s3_manager = UnifiedS3Manager()
         self.csv_manager = CSVManager()
+        self._downloader = None
         self.progress = self._load_progress()
+        # Set mirror of progress['processed'] for O(1) skip checks across runs
+        self._processed_keys = set(self.progress['processed'])
         self.stats = {
             'metadata_found': 0,
             'downloads_attempted': 0,
@@ -56,6 +73,12 @@ class MetadataDownloadProcessor:
             'csv_updated': 0
         }
         
+    def _get_downloader(self) -> UnifiedDownloader:
+        """Build the Drive downloader once and reuse it for every metadata item."""
+        if self._downloader is None:
+            self._downloader = UnifiedDownloader(config=DownloadConfig())
+        return self._downloader
+    
     def _load_progress(self) -> Dict:
         """Load progress tracking from file."""
         if os.path.exists(PROGRESS_FILE):
@@ -66,14 +89,46 @@ class MetadataDownloadProcessor:
                 logger.warning(f"Could not load progress file: {e}")
         return {'processed': [], 'failed': {}}
     
-    def _save_progress(self):
-        """Save progress tracking to file."""
+    def _save_progress(self, progress: Optional[Dict] = None):
+        """Save progress tracking (or a snapshot of it) to file."""
         try:
             with open(PROGRESS_FILE, 'w') as f:
-                json.dump(self.progress, f, indent=2)
+                f.write(json.dumps(self.progress if progress is None else progress, indent=2))
         except Exception as e:
             logger.error(f"Could not save progress: {e}")
     
+    def _progress_snapshot(self) -> Dict:
+        """Copy of progress safe to serialize while the main loop keeps mutating it."""
+        return {'processed': list(self.progress['processed']),
+                'failed': dict(self.progress['failed'])}
+    
+    def _finish_row(self, row_id: int, downloaded_files: List[str], progress: Dict) -> bool:
+        """Write a successful row's CSV update and progress (runs on the writer thread).
+        
+        Returns whether the CSV was updated; stats are tallied by the caller on
+        the main thread.
+        """
+        updated = self.update_csv_with_results(row_id, downloaded_files)
+        self._save_progress(progress)
+        return updated
+    
+    def _preflight(self) -> bool:
+        """Cheaply verify S3 credentials and yt-dlp before any download starts.
+
+        Downloads can take minutes before the first upload reveals a bad
+        credential or missing bucket, so fail fast instead.
+        """
+        try:
+            self.s3_client.head_bucket(Bucket=self.bucket_name)
+        except Exception as e:
+            logger.error(f"S3 preflight failed for bucket {self.bucket_name}: {e}")
+            return False
+
+        if shutil.which('yt-dlp') is None:
+            logger.warning("yt-dlp not found on PATH - YouTube playlist downloads will fail")
+
+        return True
+
     def load_metadata_from_s3(self) -> List[Dict]:
         """Load all metadata files from S3 clients/ directory."""
         metadata_list = []
@@ -85,7 +140,7 @@ class MetadataDownloadProcessor:
                     if obj['Key'].endswith('.json'):
                         try:
                             # Skip if already processed
-                            if obj['Key'] in self.progress['processed']:
+                            if obj['Key'] in self._processed_keys:
                                 logger.info(f"Skipping already processed: {obj['Key']}")
                                 continue
                                 
@@ -93,7 +148,7 @@ class MetadataDownloadProcessor:
                                 Bucket=self.bucket_name, 
                                 Key=obj['Key']
                             )
-                            metadata = json.loads(response['Body'].read())
+                            metadata = loads_json(response['Body'].read())
                             metadata['_s3_key'] = obj['Key']
                             metadata_list.append(metadata)
                             self.stats['metadata_found'] += 1
@@ -129,18 +184,13 @@ class MetadataDownloadProcessor:
     
     def _download_youtube_playlist_direct(self, url: str, row_context: RowContext) -> List[str]:
         """Download YouTube playlist directly using yt-dlp, bypassing error handler issues."""
+        output_dir = None
         try:
-            import subprocess
-            import re
-            import os
-            import uuid
-            
             # DRY: Use standardized download path creation
-            from utils.path_utils import create_download_path
             output_dir = create_download_path(row_context.row_id, row_context.name, 'youtube')
             
             # Extract playlist ID
-            playlist_match = re.search(r'list=([a-zA-Z0-9_-]+)', url)
+            playlist_match = PLAYLIST_ID_RE.search(url)
             if not playlist_match:
                 logger.error(f"Could not extract playlist ID from URL: {url}")
                 return []
@@ -171,13 +221,7 @@ class MetadataDownloadProcessor:
                         logger.info(f"Downloaded: {file}")
                 
                 # Upload to S3 and get UUID paths
-                s3_files = self._upload_files_to_s3(downloaded_files, row_context)
-                
-                # Clean up local files
-                import shutil
-                shutil.rmtree(output_dir)
-                
-                return s3_files
+                return self._upload_files_to_s3(downloaded_files, row_context)
             else:
                 logger.error(f"yt-dlp failed: {result.stderr}")
                 return []
@@ -185,6 +229,10 @@ class MetadataDownloadProcessor:
         except Exception as e:
             logger.error(f"Error in direct YouTube download: {e}")
             return []
+        finally:
+            # Local copies are scratch - remove them whether or not yt-dlp/upload succeeded
+            if output_dir:
+                shutil.rmtree(output_dir, ignore_errors=True)
     
     def _upload_files_to_s3(self, local_files: List[str], row_context: RowContext) -> List[str]:
         """Upload local files to S3 files/ directory with UUID names."""
@@ -197,10 +245,8 @@ class MetadataDownloadProcessor:
                 
                 # Get file extension
                 # DRY CONSOLIDATION - Step 2: Use centralized extension handling
-                from utils.path_utils import extract_extension
                 ext = extract_extension(local_file)
                 # DRY CONSOLIDATION - Step 1: Use centralized S3 key generation
-                from utils.s3_manager import UnifiedS3Manager
                 s3_key = UnifiedS3Manager.generate_uuid_s3_key(file_uuid, ext)
                 
                 # Upload to S3
@@ -214,22 +260,26 @@ class MetadataDownloadProcessor:
             
         return s3_files
 
-    def check_existing_media(self, row_id: int) -> bool:
-        """Check if person already has media files in S3."""
+    def check_existing_media(self, row_id: int, csv_row: Optional[Dict] = None) -> bool:
+        """Check if person already has media files in S3.
+        
+        Pass the row already loaded by verify_csv_rows to avoid re-reading the CSV.
+        """
         try:
-            # Check for files in S3 files/ directory
-            prefix = f"files/"
-            paginator = self.s3_client.get_paginator('list_objects_v2')
+            if csv_row is not None:
+                rows = [csv_row]
+            else:
+                # Get CSV data to check s3_paths
+                df = self.csv_manager.read('outputs/output.csv')
+                rows = (row for _, row in df.iterrows()
+                        if str(row.get('row_id', '')).strip() == str(row_id))
             
-            # Get CSV data to check s3_paths
-            df = self.csv_manager.read('outputs/output.csv')
-            for _, row in df.iterrows():
-                if str(row.get('row_id', '')).strip() == str(row_id):
-                    # DRY: Use CSVManager for S3 path loading
-                    paths = CSVManager.load_s3_paths(row)
-                    if paths:
-                            logger.info(f"Row {row_id} already has {len(paths)} files in S3")
-                            return True
+            for row in rows:
+                # DRY: Use CSVManager for S3 path loading
+                paths = CSVManager.load_s3_paths(row)
+                if paths:
+                    logger.info(f"Row {row_id} already has {len(paths)} files in S3")
+                    return True
                             
         except Exception as e:
             logger.error(f"Error checking existing media: {e}")
@@ -262,19 +312,10 @@ class MetadataDownloadProcessor:
                 logger.info(f"Processing YouTube playlist: {url}")
                 downloaded_files = self._download_youtube_playlist_direct(url, row_context)
                     
-            elif metadata_type == 'drive_file':
-                logger.info(f"Processing Drive file: {url}")
-                config = DownloadConfig()
-                downloader = UnifiedDownloader(config=config)
-                success, message = downloader.save_drive_info(url, row_context.name, int(row_context.row_id))
-                if success:
-                    downloaded_files = [message]  # message contains downloaded filename
-                    
-            elif metadata_type == 'drive_folder':
-                logger.info(f"Processing Drive folder: {url}")
-                config = DownloadConfig()
-                downloader = UnifiedDownloader(config=config)
-                success, message = downloader.save_drive_info(url, row_context.name, int(row_context.row_id))
+            elif metadata_type in DRIVE_METADATA_LABELS:
+                # Files and folders share one code path; only the log label differs
+                logger.info(f"Processing {DRIVE_METADATA_LABELS[metadata_type]}: {url}")
+                success, message = self._get_downloader().save_drive_info(url, row_context.name, int(row_context.row_id))
                 if success:
                     downloaded_files = [message]  # message contains downloaded filename
                     
@@ -295,6 +336,25 @@ class MetadataDownloadProcessor:
             self.stats['downloads_failed'] += 1
             return False, []
     
+    @staticmethod
+    def _build_csv_updates(downloaded_files: List[str]) -> Dict[str, str]:
+        """Serialize downloaded S3 files into the row's s3_paths/file_uuids columns."""
+        s3_paths = {}
+        file_uuids = {}
+        
+        for s3_file in downloaded_files:
+            # Extract UUID from s3 path (files/uuid.ext)
+            filename = os.path.basename(s3_file)
+            file_uuid = filename.split('.')[0] if '.' in filename else filename
+            
+            s3_paths[file_uuid] = s3_file
+            file_uuids[filename] = file_uuid
+        
+        return {
+            's3_paths': CSVManager.save_s3_paths(s3_paths),
+            'file_uuids': CSVManager.save_file_uuids(file_uuids)
+        }
+    
     def update_csv_with_results(self, row_id: int, downloaded_files: List[str]) -> bool:
         """Update CSV with downloaded file information."""
         if self.dry_run:
@@ -312,42 +372,25 @@ class MetadataDownloadProcessor:
                 logger.error(f"Row {row_id} not found in CSV")
                 return False
             
-            # Prepare s3_paths and file_uuids mappings
-            s3_paths = {}
-            file_uuids = {}
-            
-            for s3_file in downloaded_files:
-                # Extract UUID from s3 path (files/uuid.ext)
-                filename = os.path.basename(s3_file)
-                file_uuid = filename.split('.')[0] if '.' in filename else filename
-                
-                s3_paths[file_uuid] = s3_file
-                file_uuids[filename] = file_uuid
-            
             # Create backup before update
             backup_file = self.csv_manager.create_backup(f'metadata_{datetime.now().strftime("%Y%m%d_%H%M%S")}')
             logger.info(f"Created CSV backup: {backup_file}")
             
             # DRY: Use CSVManager to update row
-            updates = {
-                's3_paths': CSVManager.save_s3_paths(s3_paths),
-                'file_uuids': CSVManager.save_file_uuids(file_uuids)
-            }
+            updates = self._build_csv_updates(downloaded_files)
             
             if not self.csv_manager.update_row_by_id(row_id, updates):
                 logger.error(f"Failed to update row {row_id}")
                 return False
             
             logger.info(f"Updated CSV row {row_id} with {len(downloaded_files)} files")
-            logger.info(f"  s3_paths: {CSVManager.save_s3_paths(s3_paths)}")
-            logger.info(f"  file_uuids: {CSVManager.save_file_uuids(file_uuids)}")
+            logger.info(f"  s3_paths: {updates['s3_paths']}")
+            logger.info(f"  file_uuids: {updates['file_uuids']}")
             
-            self.stats['csv_updated'] += 1
             return True
             
         except Exception as e:
             logger.error(f"Error updating CSV: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return False
     
@@ -362,6 +405,11 @@ class MetadataDownloadProcessor:
         logger.info(f"Target rows: {target_rows}")
         logger.info(f"Dry run: {self.dry_run}")
         
+        # Step 0: Fail fast on bad credentials before spending time on downloads
+        if not self.dry_run and not self._preflight():
+            logger.error("Preflight check failed, aborting")
+            return
+        
         # Step 1: Verify CSV rows exist
         logger.info("Verifying CSV rows...")
         csv_data = self.verify_csv_rows(target_rows)
@@ -380,37 +428,46 @@ class MetadataDownloadProcessor:
         logger.info(f"Found {len(filtered_metadata)} metadata files for target rows")
         
         # Step 4: Process each metadata file
-        for metadata in filtered_metadata:
-            row_id = metadata.get('row_id')
-            person_name = metadata.get('person', 'Unknown')
-            
-            logger.info(f"\nProcessing {row_id} - {person_name}")
-            
-            # Check if already has media
-            if self.check_existing_media(row_id):
-                logger.info(f"Row {row_id} already has media files, skipping")
-                continue
+        # CSV updates and progress saves run on a single writer thread (keeping
+        # them ordered) so the next download starts without waiting on disk I/O
+        csv_writes = []
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for metadata in filtered_metadata:
+                row_id = metadata.get('row_id')
+                person_name = metadata.get('person', 'Unknown')
                 
-            # Get CSV row data
-            if row_id not in csv_data:
-                logger.warning(f"No CSV row found for {row_id}, skipping")
-                continue
+                logger.info(f"\nProcessing {row_id} - {person_name}")
                 
-            # Process the metadata
-            self.stats['downloads_attempted'] += 1
-            success, files = self.process_metadata(metadata, csv_data[row_id])
-            
-            if success:
-                # Update CSV with results
-                self.update_csv_with_results(row_id, files)
+                # Get CSV row data
+                if row_id not in csv_data:
+                    logger.warning(f"No CSV row found for {row_id}, skipping")
+                    continue
                 
-                # Mark as processed
-                self.progress['processed'].append(metadata['_s3_key'])
-                self._save_progress()
-            else:
-                # Track failure
-                self.progress['failed'][metadata['_s3_key']] = datetime.now().isoformat()
-                self._save_progress()
+                # Check if already has media
+                if self.check_existing_media(row_id, csv_data[row_id]):
+                    logger.info(f"Row {row_id} already has media files, skipping")
+                    continue
+                    
+                # Process the metadata
+                self.stats['downloads_attempted'] += 1
+                success, files = self.process_metadata(metadata, csv_data[row_id])
+                
+                if success:
+                    # Mark as processed, then update CSV and save progress in the background
+                    self.progress['processed'].append(metadata['_s3_key'])
+                    self._processed_keys.add(metadata['_s3_key'])
+                    if files and not self.dry_run:
+                        # Keep the cached row current so a later metadata file for
+                        # the same row sees these paths in check_existing_media
+                        csv_data[row_id].update(self._build_csv_updates(files))
+                    csv_writes.append(writer.submit(self._finish_row, row_id, files, self._progress_snapshot()))
+                else:
+                    # Track failure
+                    self.progress['failed'][metadata['_s3_key']] = datetime.now().isoformat()
+                    writer.submit(self._save_progress, self._progress_snapshot())
+        
+        if not self.dry_run:
+            self.stats['csv_updated'] += sum(future.result() for future in csv_writes)
         
         # Report statistics
         print_section_header("PROCESSING COMPLETE")
@@ -7,10 +7,14 @@ import os
 import sys
 import time
 
-# Add parent directory to path so we can import utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.extract_links import process_url
+# Resolve utils normally (installed / PYTHONPATH); only fall back to mutating sys.path if that fails
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    from utils.extract_links import process_url
+except ImportError:
+    if PROJECT_DIR not in sys.path:
+        sys.path.append(PROJECT_DIR)
+    from utils.extract_links import process_url
 
 def process_unprocessed_rows(csv_path, start_row=0, max_rows=None, delay_seconds=2):
     """
@@ -5,12 +5,25 @@ Run Google Drive downloads in background from CSV file
 import os
 import sys
 import csv
-import subprocess
-import time
+import asyncio
 from datetime import datetime
 
+# Prefer uvloop (libuv-based, faster scheduling/subprocess handling) when installed
+try:
+    import uvloop
+    run_event_loop = uvloop.run
+except (ImportError, AttributeError):  # AttributeError: uvloop < 0.18 has no run()
+    run_event_loop = asyncio.run
+
 # Add parent directory to path to access utils
-sys.path.insert(0, '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal')
+UTILS_ROOT = '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal'
+if UTILS_ROOT not in sys.path:
+    sys.path.insert(0, UTILS_ROOT)
+
+# Resolved once at import rather than on every call
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+VENV_PYTHON = os.path.join(SCRIPT_DIR, 'venv', 'bin', 'python')
+DOWNLOAD_SCRIPT = os.path.join(SCRIPT_DIR, 'utils', 'download_drive.py')
 
 from utils.config import get_config
 from utils.validation import validate_google_drive_url
@@ -46,11 +59,40 @@ def get_drive_urls_from_csv():
     
     return drive_urls
 
-def download_drive_async(urls, max_downloads=None):
-    """Download Google Drive files asynchronously"""
-    venv_python = os.path.join(os.path.dirname(__file__), 'venv', 'bin', 'python')
-    download_script = os.path.join(os.path.dirname(__file__), 'utils', 'download_drive.py')
-    
+async def _download_one(item, index, total, cmd_prefix, sem, log):
+    """Run a single download subprocess, bounded by the shared semaphore"""
+    async with sem:
+        # Downloads overlap, so every log line carries its item tag
+        tag = f"[{index}/{total}] {item['name']}"
+        print(f"\n[{index}/{total}] Processing {item['name']}: {item['url']}")
+        log.write(f"\n[{index}/{total}] Processing {item['name']}: {item['url']}\n")
+        
+        try:
+            # Run download command with metadata flag
+            proc = await asyncio.create_subprocess_exec(
+                *cmd_prefix, item['url'], '--metadata',
+                stdout=asyncio.subprocess.DEVNULL,  # Output is never read; don't make the loop drain it
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await proc.communicate()
+            
+            if proc.returncode == 0:
+                print(f"✓ Successfully downloaded from {item['name']}")
+                log.write(f"{tag} ✓ Success\n")
+                return True
+            
+            stderr = stderr.decode('utf-8', errors='replace')
+            print(f"✗ Failed to download from {item['name']}: {stderr}")
+            log.write(f"{tag} ✗ Failed: {stderr}\n")
+                
+        except Exception as e:
+            print(f"✗ Error processing {item['name']}: {str(e)}")
+            log.write(f"{tag} ✗ Error: {str(e)}\n")
+        
+        return False
+
+def download_drive_async(urls, max_downloads=None, concurrency=4):
+    """Download Google Drive files concurrently (at most `concurrency` at a time)"""
     print(f"Found {len(urls)} Google Drive files to process")
     
     if max_downloads:
@@ -61,34 +103,23 @@ def download_drive_async(urls, max_downloads=None):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = f'drive_downloads_{timestamp}.log'
     
+    async def run_all(log):
+        # Bounded semaphore keeps us respectful to Drive while overlapping network waits
+        sem = asyncio.Semaphore(max(1, concurrency))
+        cmd_prefix = (VENV_PYTHON, DOWNLOAD_SCRIPT)
+        return await asyncio.gather(*[
+            _download_one(item, i, len(urls), cmd_prefix, sem, log)
+            for i, item in enumerate(urls, 1)
+        ])
+    
     with open(log_file, 'w') as log:
         log.write(f"Google Drive download started at {datetime.now()}\n")
-        log.write(f"Processing {len(urls)} files\n\n")
+        log.write(f"Processing {len(urls)} files (concurrency={concurrency})\n\n")
         
-        for i, item in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing {item['name']}: {item['url']}")
-            log.write(f"\n[{i}/{len(urls)}] Processing {item['name']}: {item['url']}\n")
-            
-            try:
-                # Run download command with metadata flag
-                cmd = [venv_python, download_script, item['url'], '--metadata']
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    print(f"✓ Successfully downloaded from {item['name']}")
-                    log.write(f"✓ Success\n")
-                else:
-                    print(f"✗ Failed to download from {item['name']}: {result.stderr}")
-                    log.write(f"✗ Failed: {result.stderr}\n")
-                    
-            except Exception as e:
-                print(f"✗ Error processing {item['name']}: {str(e)}")
-                log.write(f"✗ Error: {str(e)}\n")
-            
-            # Small delay between downloads to be respectful
-            time.sleep(1)
+        results = run_event_loop(run_all(log))
     
-    print(f"\nDownload log saved to: {log_file}")
+    print(f"\n{sum(results)}/{len(results)} downloads succeeded")
+    print(f"Download log saved to: {log_file}")
     return log_file
 
 if __name__ == "__main__":
@@ -96,6 +127,7 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Download Google Drive files from CSV in background')
     parser.add_argument('--max-downloads', type=int, help='Maximum number of files to download')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximum simultaneous downloads (default: 4)')
     
     args = parser.parse_args()
     
@@ -107,5 +139,5 @@ if __name__ == "__main__":
         sys.exit(0)
     
     # Start downloads
-    log_file = download_drive_async(urls, args.max_downloads)
+    log_file = download_drive_async(urls, args.max_downloads, args.concurrency)
     print(f"\nDownloads complete. Check {log_file} for details.")
\ No newline at end of file
@@ -5,12 +5,25 @@ Run YouTube downloads in background from CSV file
 import os
 import sys
 import csv
-import subprocess
-import time
+import asyncio
 from datetime import datetime
 
+# Prefer uvloop (libuv-based, faster scheduling/subprocess handling) when installed
+try:
+    import uvloop
+    run_event_loop = uvloop.run
+except (ImportError, AttributeError):  # AttributeError: uvloop < 0.18 has no run()
+    run_event_loop = asyncio.run
+
 # Add original project directory to path to access utils
-sys.path.insert(0, '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal')
+UTILS_ROOT = '/home/Mike/projects/xenodex/typing-clients-ingestion-minimal'
+if UTILS_ROOT not in sys.path:
+    sys.path.insert(0, UTILS_ROOT)
+
+# Resolved once at import rather than on every call
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+VENV_PYTHON = os.path.join(SCRIPT_DIR, 'venv', 'bin', 'python')
+DOWNLOAD_SCRIPT = os.path.join(SCRIPT_DIR, 'utils', 'download_youtube.py')
 
 from utils.config import get_config
 from utils.validation import validate_youtube_url
@@ -37,11 +50,40 @@ def get_youtube_urls_from_csv():
     
     return youtube_urls
 
-def download_youtube_async(urls, max_downloads=None):
-    """Download YouTube videos asynchronously"""
-    venv_python = os.path.join(os.path.dirname(__file__), 'venv', 'bin', 'python')
-    download_script = os.path.join(os.path.dirname(__file__), 'utils', 'download_youtube.py')
-    
+async def _download_one(item, index, total, sem, log):
+    """Run a single playlist download subprocess, bounded by the shared semaphore"""
+    async with sem:
+        # Downloads overlap, so every log line carries its item tag
+        tag = f"[{index}/{total}] {item['name']}"
+        print(f"\n[{index}/{total}] Processing {item['name']}: {item['url']}")
+        log.write(f"\n[{index}/{total}] Processing {item['name']}: {item['url']}\n")
+        
+        try:
+            # Run download command
+            proc = await asyncio.create_subprocess_exec(
+                VENV_PYTHON, DOWNLOAD_SCRIPT, item['url'],
+                stdout=asyncio.subprocess.DEVNULL,  # Output is never read; don't make the loop drain it
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await proc.communicate()
+            
+            if proc.returncode == 0:
+                print(f"✓ Successfully processed {item['name']}")
+                log.write(f"{tag} ✓ Success\n")
+                return True
+            
+            stderr = stderr.decode('utf-8', errors='replace')
+            print(f"✗ Failed to process {item['name']}: {stderr}")
+            log.write(f"{tag} ✗ Failed: {stderr}\n")
+                
+        except Exception as e:
+            print(f"✗ Error processing {item['name']}: {str(e)}")
+            log.write(f"{tag} ✗ Error: {str(e)}\n")
+        
+        return False
+
+def download_youtube_async(urls, max_downloads=None, concurrency=2):
+    """Download YouTube playlists concurrently (at most `concurrency` at a time)"""
     print(f"Found {len(urls)} YouTube playlists to process")
     
     if max_downloads:
@@ -52,34 +94,22 @@ def download_youtube_async(urls, max_downloads=None):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = f'youtube_downloads_{timestamp}.log'
     
+    async def run_all(log):
+        # Kept low by default - yt-dlp is throttled by YouTube per client
+        sem = asyncio.Semaphore(max(1, concurrency))
+        return await asyncio.gather(*[
+            _download_one(item, i, len(urls), sem, log)
+            for i, item in enumerate(urls, 1)
+        ])
+    
     with open(log_file, 'w') as log:
         log.write(f"YouTube download started at {datetime.now()}\n")
-        log.write(f"Processing {len(urls)} playlists\n\n")
+        log.write(f"Processing {len(urls)} playlists (concurrency={concurrency})\n\n")
         
-        for i, item in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing {item['name']}: {item['url']}")
-            log.write(f"\n[{i}/{len(urls)}] Processing {item['name']}: {item['url']}\n")
-            
-            try:
-                # Run download command
-                cmd = [venv_python, download_script, item['url']]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    print(f"✓ Successfully processed {item['name']}")
-                    log.write(f"✓ Success\n")
-                else:
-                    print(f"✗ Failed to process {item['name']}: {result.stderr}")
-                    log.write(f"✗ Failed: {result.stderr}\n")
-                    
-            except Exception as e:
-                print(f"✗ Error processing {item['name']}: {str(e)}")
-                log.write(f"✗ Error: {str(e)}\n")
-            
-            # Small delay between downloads to be respectful
-            time.sleep(2)
+        results = run_event_loop(run_all(log))
     
-    print(f"\nDownload log saved to: {log_file}")
+    print(f"\n{sum(results)}/{len(results)} playlists succeeded")
+    print(f"Download log saved to: {log_file}")
     return log_file
 
 if __name__ == "__main__":
@@ -87,6 +117,7 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Download YouTube videos from CSV in background')
     parser.add_argument('--max-downloads', type=int, help='Maximum number of playlists to download')
+    parser.add_argument('--concurrency', type=int, default=2, help='Maximum simultaneous playlist downloads (default: 2)')
     
     args = parser.parse_args()
     
@@ -98,5 +129,5 @@ if __name__ == "__main__":
         sys.exit(0)
     
     # Start downloads
-    log_file = download_youtube_async(urls, args.max_downloads)
+    log_file = download_youtube_async(urls, args.max_downloads, args.concurrency)
     print(f"\nDownloads complete. Check {log_file} for details.")
\ No newline at end of file
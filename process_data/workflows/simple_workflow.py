@@ -7,6 +7,8 @@ Keep it simple. No over-engineering.
 import pandas as pd
 import re
 import argparse
+import contextlib
+import gc
 import sys
 import json
 import pickle
@@ -16,6 +18,7 @@ from urllib.parse import urlparse
 import os
 import urllib.parse
 import time
+from functools import lru_cache
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -39,6 +42,90 @@ config = get_config()
 
 # Selenium driver functions now imported from patterns.py (DRY consolidation)
 
+# Centralized link patterns scanned by step4_extract_links (DRY), built once
+YOUTUBE_LINK_PATTERNS = (
+    PatternRegistry.YOUTUBE_VIDEO_FULL,
+    PatternRegistry.YOUTUBE_SHORT_FULL,
+    PatternRegistry.YOUTUBE_PLAYLIST_FULL
+)
+DRIVE_LINK_PATTERNS = (
+    PatternRegistry.DRIVE_FILE_FULL,
+    PatternRegistry.DRIVE_OPEN_FULL,
+    PatternRegistry.DRIVE_FOLDER_FULL
+)
+
+# YouTube playlist links with a Unicode-escaped '=' (common in Google Docs HTML)
+ESCAPED_PLAYLIST_PATTERN = re.compile(r'youtube\.com/playlist\?list\\u003d([a-zA-Z0-9_-]+)')
+
+# Infrastructure/noise patterns excluded by filter_meaningful_links
+LINK_NOISE_PATTERNS = [
+    # Google infrastructure
+    r'accounts\.google\.com',
+    r'apis\.google\.com', 
+    r'clients6\.google\.com',
+    r'gstatic\.com',
+    r'googleapis\.com',
+    r'googleusercontent\.com',
+    r'ogs\.google\.com',
+    r'ogads-pa\.clients6\.google\.com',
+    r'people-pa\.clients6\.google\.com',
+    r'addons.*\.google\.com',
+    r'workspace\.google\.com',
+    r'myaccount\.google\.com',
+    r'contacts\.google\.com',
+    r'script\.google\.com',
+    r'drivefrontend-pa\.clients6\.google\.com',
+    
+    # Chrome extensions and static resources
+    r'chrome\.google\.com/webstore',
+    r'docs\.google\.com/static/',
+    r'docs\.google\.com/persistent/',
+    r'docs\.google\.com/relay\.html',
+    r'docs\.google\.com/picker',
+    r'docs\.google\.com/drawings',
+    
+    # Document-specific URLs (not content)
+    r'docs\.google\.com/document/.*edit',
+    r'docs\.google\.com/document/.*preview',
+    r'docs\.google\.com/document/\?usp=docs_web',
+    r'&amp;usp=embed_',
+    r'\?tab=t\.',
+    
+    # Schema.org and other metadata
+    r'schema\.org',
+    r'meet\.google\.com',
+    
+    # Non-content file extensions
+    r'\.js$',
+    r'\.css$',
+    r'\.woff2?$',
+    r'\.ico$',
+    r'\.gif$',
+    r'\.binarypb$',
+    r'\.model$'
+]
+
+# One alternation scanned once per link instead of one re.search per pattern
+LINK_NOISE_RE = re.compile('|'.join(LINK_NOISE_PATTERNS))
+MEANINGFUL_YOUTUBE_RE = re.compile(r'(watch\?v=|playlist\?list=|youtu\.be/[a-zA-Z0-9_-]{11})')
+MEANINGFUL_DRIVE_RE = re.compile(r'(file/d/[a-zA-Z0-9_-]+|drive/folders/[a-zA-Z0-9_-]+)')
+PLAYLIST_LIST_PARAM_RE = re.compile(r'list=([a-zA-Z0-9_-]+)')
+
+@contextlib.contextmanager
+def gc_paused():
+    """Suspend cyclic GC while building a large object graph (e.g. a sheet's parse tree).
+    
+    BeautifulSoup trees are full of parent/sibling reference cycles, so every generation-0
+    threshold crossing mid-parse re-traverses the growing tree. One pass afterwards is enough.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
 # Progress tracking functions (DRY: using centralized state management)
 # Progress management functions removed - now using centralized load_json_state/save_json_state (DRY)
 
@@ -62,15 +149,32 @@ def step1_download_sheet():
     """Step 1: Download a local copy of the Google Sheet"""
     print("Step 1: Downloading Google Sheet...")
     
+    sheet_cache_path = config.get('paths.sheet_cache', 'sheet.html')
+    validators_path = f"{sheet_cache_path}.meta.json"
+    
     # First try HTTP request (faster)
     try:
         print("  Trying HTTP download...")
-        response = http_get(config.get("google_sheets.url"))
+        # Conditional GET: an unchanged sheet costs a 304 with no body
+        headers = {}
+        if os.path.exists(sheet_cache_path):
+            validators = load_json_state(validators_path, {})
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        
+        response = http_get(config.get("google_sheets.url"), headers=headers)
+        if response.status_code == 304:
+            print("  ✓ Sheet unchanged since last download, using cached copy")
+            with open(sheet_cache_path, "r", encoding="utf-8") as f:
+                return f.read()
         response.raise_for_status()
         html_content = response.text
         
         # Quick check if we got actual data
-        soup = BeautifulSoup(html_content, "html.parser")
+        with gc_paused():
+            soup = BeautifulSoup(html_content, "html.parser")
         
         # Look for the specific div with target ID
         target_div = soup.find("div", {"id": str(config.get("google_sheets.target_div_id"))})
@@ -87,10 +191,13 @@ def step1_download_sheet():
         if table:
             rows = table.find_all("tr")
             if len(rows) > 1:  # More than just header
-                # Save the HTML
-                sheet_cache_path = get_config().get('paths.sheet_cache', 'sheet.html')
+                # Save the HTML and its validators for the next conditional GET
                 with open(sheet_cache_path, "w", encoding="utf-8") as f:
                     f.write(html_content)
+                save_json_state(validators_path, {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                })
                 
                 print(f"  ✓ Sheet downloaded via HTTP (found {len(rows)} rows)")
                 return html_content
@@ -145,10 +252,11 @@ def step1_download_sheet():
         # Get the page source after JavaScript has executed
         html_content = driver.page_source
         
-        # Save the HTML
-        sheet_cache_path = get_config().get('paths.sheet_cache', 'sheet.html')
+        # Save the HTML (no HTTP validators for a rendered page - drop stale ones)
         with open(sheet_cache_path, "w", encoding="utf-8") as f:
             f.write(html_content)
+        if os.path.exists(validators_path):
+            os.remove(validators_path)
         
         print("✓ Sheet downloaded with Selenium")
         return html_content
@@ -165,7 +273,8 @@ def step2_extract_people_and_docs(html_content):
     """Step 2: Extract people data and Google Doc links from the sheet"""
     print("Step 2: Extracting people data and Google Doc links...")
     
-    soup = BeautifulSoup(html_content, "html.parser")
+    with gc_paused():
+        soup = BeautifulSoup(html_content, "html.parser")
     
     # Look for the specific div with target ID
     target_div = soup.find("div", {"id": str(config.get("google_sheets.target_div_id"))})
@@ -292,58 +401,35 @@ def step4_extract_links(doc_content, doc_text=""):
         # If decoding fails, continue with original content
         pass
     
+    # Sets give O(1) membership while collecting; converted to lists at the end
     links = {
-        'youtube': [],
-        'drive_files': [],
-        'drive_folders': [],
-        'all_links': []
+        'youtube': set(),
+        'drive_files': set(),
+        'drive_folders': set(),
+        'all_links': set()
     }
     
     # Use centralized YouTube patterns (DRY)
-    youtube_patterns = [
-        PatternRegistry.YOUTUBE_VIDEO_FULL,
-        PatternRegistry.YOUTUBE_SHORT_FULL,
-        PatternRegistry.YOUTUBE_PLAYLIST_FULL
-    ]
-    
-    for pattern in youtube_patterns:
+    for pattern in YOUTUBE_LINK_PATTERNS:
         matches = pattern.findall(combined_content)
         for match in matches:
             if pattern == PatternRegistry.YOUTUBE_PLAYLIST_FULL:
-                clean_link = URLPatterns.youtube_playlist_url(match)
+                links['youtube'].add(URLPatterns.youtube_playlist_url(match))
             else:
-                clean_link = URLPatterns.youtube_watch_url(match)
-            
-            if clean_link not in links['youtube']:
-                links['youtube'].append(clean_link)
+                links['youtube'].add(URLPatterns.youtube_watch_url(match))
     
     # Also try to find YouTube playlists with Unicode escapes (common in Google Docs)
-    import re
-    escaped_playlist_pattern = re.compile(r'youtube\.com/playlist\?list\\u003d([a-zA-Z0-9_-]+)')
-    escaped_matches = escaped_playlist_pattern.findall(combined_content)
-    for match in escaped_matches:
-        clean_link = URLPatterns.youtube_playlist_url(match)
-        if clean_link not in links['youtube']:
-            links['youtube'].append(clean_link)
+    for match in ESCAPED_PLAYLIST_PATTERN.findall(combined_content):
+        links['youtube'].add(URLPatterns.youtube_playlist_url(match))
     
     # Use centralized Google Drive patterns (DRY)
-    drive_patterns = [
-        PatternRegistry.DRIVE_FILE_FULL,
-        PatternRegistry.DRIVE_OPEN_FULL,
-        PatternRegistry.DRIVE_FOLDER_FULL
-    ]
-    
-    for pattern in drive_patterns:
+    for pattern in DRIVE_LINK_PATTERNS:
         matches = pattern.findall(combined_content)
         for match in matches:
             if pattern == PatternRegistry.DRIVE_FOLDER_FULL:
-                clean_link = URLPatterns.drive_folder_url(match)
-                if clean_link not in links['drive_folders']:
-                    links['drive_folders'].append(clean_link)
+                links['drive_folders'].add(URLPatterns.drive_folder_url(match))
             else:
-                clean_link = URLPatterns.drive_file_url(match, view=True)
-                if clean_link not in links['drive_files']:
-                    links['drive_files'].append(clean_link)
+                links['drive_files'].add(URLPatterns.drive_file_url(match, view=True))
     
     # Extract all HTTP(S) links for comprehensive coverage using centralized pattern (DRY)
     all_found_links = PatternRegistry.HTTP_URL.findall(combined_content)
@@ -352,21 +438,17 @@ def step4_extract_links(doc_content, doc_text=""):
     for link in all_found_links:
         clean_link = clean_url(link)
         if clean_link and clean_link not in links['all_links']:
-            links['all_links'].append(clean_link)
+            links['all_links'].add(clean_link)
             
             # Additional categorization for missed links
-            if ('youtube.com' in clean_link or 'youtu.be' in clean_link) and clean_link not in links['youtube']:
-                links['youtube'].append(clean_link)
-            elif 'drive.google.com/file' in clean_link and clean_link not in links['drive_files']:
-                links['drive_files'].append(clean_link)
-            elif 'drive.google.com/drive/folders' in clean_link and clean_link not in links['drive_folders']:
-                links['drive_folders'].append(clean_link)
-    
-    # Remove duplicates
-    links['youtube'] = list(set(links['youtube']))
-    links['drive_files'] = list(set(links['drive_files']))
-    links['drive_folders'] = list(set(links['drive_folders']))
-    links['all_links'] = list(set(links['all_links']))
+            if 'youtube.com' in clean_link or 'youtu.be' in clean_link:
+                links['youtube'].add(clean_link)
+            elif 'drive.google.com/file' in clean_link:
+                links['drive_files'].add(clean_link)
+            elif 'drive.google.com/drive/folders' in clean_link:
+                links['drive_folders'].add(clean_link)
+    
+    links = {category: list(found) for category, found in links.items()}
     
     total_links = len(links['youtube']) + len(links['drive_files']) + len(links['drive_folders'])
     print(f"✓ Found {total_links} targeted links (YT: {len(links['youtube'])}, Files: {len(links['drive_files'])}, Folders: {len(links['drive_folders'])})")
@@ -378,78 +460,29 @@ def filter_meaningful_links(links):
     """Filter extracted links to only meaningful content links (like operators do)"""
     print("  Filtering meaningful links...")
     
-    # Define infrastructure/noise patterns to exclude
-    noise_patterns = [
-        # Google infrastructure
-        r'accounts\.google\.com',
-        r'apis\.google\.com', 
-        r'clients6\.google\.com',
-        r'gstatic\.com',
-        r'googleapis\.com',
-        r'googleusercontent\.com',
-        r'ogs\.google\.com',
-        r'ogads-pa\.clients6\.google\.com',
-        r'people-pa\.clients6\.google\.com',
-        r'addons.*\.google\.com',
-        r'workspace\.google\.com',
-        r'myaccount\.google\.com',
-        r'contacts\.google\.com',
-        r'script\.google\.com',
-        r'drivefrontend-pa\.clients6\.google\.com',
-        
-        # Chrome extensions and static resources
-        r'chrome\.google\.com/webstore',
-        r'docs\.google\.com/static/',
-        r'docs\.google\.com/persistent/',
-        r'docs\.google\.com/relay\.html',
-        r'docs\.google\.com/picker',
-        r'docs\.google\.com/drawings',
-        
-        # Document-specific URLs (not content)
-        r'docs\.google\.com/document/.*edit',
-        r'docs\.google\.com/document/.*preview',
-        r'docs\.google\.com/document/\?usp=docs_web',
-        r'&amp;usp=embed_',
-        r'\?tab=t\.',
-        
-        # Schema.org and other metadata
-        r'schema\.org',
-        r'meet\.google\.com',
-        
-        # Non-content file extensions
-        r'\.js$',
-        r'\.css$',
-        r'\.woff2?$',
-        r'\.ico$',
-        r'\.gif$',
-        r'\.binarypb$',
-        r'\.model$'
-    ]
-    
     def is_meaningful_link(link):
         """Check if a link is meaningful content vs infrastructure noise"""
-        link_lower = link.lower()
-        
         # Check against noise patterns
-        for pattern in noise_patterns:
-            if re.search(pattern, link):
-                return False
+        if LINK_NOISE_RE.search(link):
+            return False
+        
+        link_lower = link.lower()
         
         # Keep YouTube content links
-        if any(domain in link_lower for domain in ['youtube.com', 'youtu.be']):
+        if 'youtube.com' in link_lower or 'youtu.be' in link_lower:
             # Must be actual video or playlist, not just any YouTube URL
-            return bool(re.search(r'(watch\?v=|playlist\?list=|youtu\.be/[a-zA-Z0-9_-]{11})', link))
+            return bool(MEANINGFUL_YOUTUBE_RE.search(link))
         
         # Keep Drive files and folders (but not just drive.google.com root)
         if 'drive.google.com' in link_lower:
-            return bool(re.search(r'(file/d/[a-zA-Z0-9_-]+|drive/folders/[a-zA-Z0-9_-]+)', link))
+            return bool(MEANINGFUL_DRIVE_RE.search(link))
         
         return False
     
-    # Filter all link categories
-    meaningful_youtube = []
-    meaningful_drive_files = []
-    meaningful_drive_folders = []
+    # Filter all link categories (sets dedupe as we go; sorted once at the end)
+    meaningful_youtube = set()
+    meaningful_drive_files = set()
+    meaningful_drive_folders = set()
     
     # Process YouTube links
     for link in links.get('youtube', []):
@@ -458,15 +491,15 @@ def filter_meaningful_links(links):
             if '/watch?v=' in link:
                 video_id = extract_youtube_id(link)
                 if video_id:
-                    meaningful_youtube.append(URLPatterns.youtube_watch_url(video_id))
+                    meaningful_youtube.add(URLPatterns.youtube_watch_url(video_id))
             elif '/playlist?list=' in link:
-                match = re.search(r'list=([a-zA-Z0-9_-]+)', link)
+                match = PLAYLIST_LIST_PARAM_RE.search(link)
                 if match:
-                    meaningful_youtube.append(URLPatterns.youtube_playlist_url(match.group(1)))
+                    meaningful_youtube.add(URLPatterns.youtube_playlist_url(match.group(1)))
             elif 'youtu.be/' in link:
                 video_id = extract_youtube_id(link)
                 if video_id:
-                    meaningful_youtube.append(URLPatterns.youtube_watch_url(video_id))
+                    meaningful_youtube.add(URLPatterns.youtube_watch_url(video_id))
     
     # Process Drive files
     for link in links.get('drive_files', []):
@@ -474,7 +507,7 @@ def filter_meaningful_links(links):
             # Normalize Drive file URLs using centralized extraction
             file_id = extract_drive_id(link)
             if file_id:
-                meaningful_drive_files.append(URLPatterns.drive_file_url(file_id, view=True))
+                meaningful_drive_files.add(URLPatterns.drive_file_url(file_id, view=True))
     
     # Process Drive folders  
     for link in links.get('drive_folders', []):
@@ -482,33 +515,34 @@ def filter_meaningful_links(links):
             # Normalize Drive folder URLs using centralized extraction
             folder_id = extract_drive_id(link)
             if folder_id:
-                meaningful_drive_folders.append(URLPatterns.drive_folder_url(folder_id))
+                meaningful_drive_folders.add(URLPatterns.drive_folder_url(folder_id))
     
     # Also check all_links for any missed content links
     for link in links.get('all_links', []):
         if is_meaningful_link(link):
-            if any(pattern in link.lower() for pattern in ['youtube.com', 'youtu.be']) and link not in meaningful_youtube:
+            link_lower = link.lower()
+            if 'youtube.com' in link_lower or 'youtu.be' in link_lower:
                 # Process as YouTube using centralized extraction
                 video_id = extract_youtube_id(link)
                 if video_id:
-                    meaningful_youtube.append(URLPatterns.youtube_watch_url(video_id))
+                    meaningful_youtube.add(URLPatterns.youtube_watch_url(video_id))
                 elif '/playlist?list=' in link:
-                    match = re.search(r'list=([a-zA-Z0-9_-]+)', link)
+                    match = PLAYLIST_LIST_PARAM_RE.search(link)
                     if match:
-                        meaningful_youtube.append(URLPatterns.youtube_playlist_url(match.group(1)))
-            elif 'drive.google.com/file' in link and link not in meaningful_drive_files:
+                        meaningful_youtube.add(URLPatterns.youtube_playlist_url(match.group(1)))
+            elif 'drive.google.com/file' in link:
                 file_id = extract_drive_id(link)
                 if file_id:
-                    meaningful_drive_files.append(URLPatterns.drive_file_url(file_id, view=True))
-            elif 'drive.google.com/drive/folders' in link and link not in meaningful_drive_folders:
+                    meaningful_drive_files.add(URLPatterns.drive_file_url(file_id, view=True))
+            elif 'drive.google.com/drive/folders' in link:
                 folder_id = extract_drive_id(link)
                 if folder_id:
-                    meaningful_drive_folders.append(URLPatterns.drive_folder_url(folder_id))
+                    meaningful_drive_folders.add(URLPatterns.drive_folder_url(folder_id))
     
-    # Remove duplicates and sort
-    meaningful_youtube = sorted(list(set(meaningful_youtube)))
-    meaningful_drive_files = sorted(list(set(meaningful_drive_files))) 
-    meaningful_drive_folders = sorted(list(set(meaningful_drive_folders)))
+    # Sort for stable output
+    meaningful_youtube = sorted(meaningful_youtube)
+    meaningful_drive_files = sorted(meaningful_drive_files)
+    meaningful_drive_folders = sorted(meaningful_drive_folders)
     
     print(f"    Filtered: {len(meaningful_youtube)} YouTube, {len(meaningful_drive_files)} Drive files, {len(meaningful_drive_folders)} Drive folders")
     
@@ -518,6 +552,18 @@ def filter_meaningful_links(links):
         'drive_folders': meaningful_drive_folders
     }
 
+@lru_cache(maxsize=1)
+def get_streaming_s3_manager():
+    """Shared S3 manager for step 5 streaming - config is fixed, so build it (and its client) once"""
+    s3_config = S3Config(
+        bucket_name=config.get("downloads.s3.default_bucket", "typing-clients-uuid-system"),
+        upload_mode=UploadMode.DIRECT_STREAMING,
+        organize_by_person=False,
+        add_metadata=True
+    )
+    return UnifiedS3Manager(s3_config)
+
+
 def step5_process_extracted_data(person, links, doc_text=""):
     """Step 5: Process extracted data and stream to S3, then format for CSV"""
     print("Step 5: Processing extracted data...")
@@ -538,14 +584,7 @@ def step5_process_extracted_data(person, links, doc_text=""):
     if total_links > 0 and config.get("downloads.storage_mode") == "s3":
         print(f"  🚀 Streaming {total_links} links directly to S3...")
         
-        # Initialize S3 manager
-        s3_config = S3Config(
-            bucket_name=config.get("downloads.s3.default_bucket", "typing-clients-uuid-system"),
-            upload_mode=UploadMode.DIRECT_STREAMING,
-            organize_by_person=False,
-            add_metadata=True
-        )
-        s3_manager = UnifiedS3Manager(s3_config)
+        s3_manager = get_streaming_s3_manager()
         
         # Stream links to S3 and get UUID mappings
         try:
@@ -585,11 +624,9 @@ def step5_process_extracted_data(person, links, doc_text=""):
 
 # extract_text_with_retry function moved to utils/extract_links.py (DRY consolidation)
 
-def step6_map_data(processed_records, basic_mode=False, text_mode=False, output_file=None):
-    """Step 6: Map data to CSV"""
-    print("Step 6: Mapping data to CSV...")
-    
-    # Handle different column sets based on processing mode (DRY: use config)
+@lru_cache(maxsize=None)
+def get_mode_output_settings(basic_mode=False, text_mode=False):
+    """Resolve (required_columns, default_output_file) for a processing mode once (DRY: use config)"""
     if basic_mode:
         # Basic mode: only 5 columns
         required_columns = config.get('csv_columns.basic')
@@ -600,29 +637,33 @@ def step6_map_data(processed_records, basic_mode=False, text_mode=False, output_
         # Full mode: all columns matching main system
         required_columns = config.get('csv_columns.full')
     
-    # Ensure all required columns are present in records
-    for record in processed_records:
-        for col in required_columns:
-            if col not in record:
-                record[col] = ''
+    if text_mode and not basic_mode:
+        default_output_file = "/home/Mike/Xenodex/fulfillment/data/text_extraction_output.csv"
+    else:
+        default_output_file = config.get("paths.output_csv", "/home/Mike/Xenodex/fulfillment/data/simple_output.csv")
     
-    # Filter records to only include required columns in correct order
+    return tuple(required_columns), default_output_file
+
+
+def fill_and_filter_records(records, required_columns):
+    """Add missing required columns to each record (in place) and return them filtered to those columns, in order"""
     filtered_records = []
-    for record in processed_records:
-        filtered_record = {col: record.get(col, '') for col in required_columns}
-        filtered_records.append(filtered_record)
-    
-    # Determine output file
-    if not output_file:
-        if basic_mode:
-            output_file = config.get("paths.output_csv", "/home/Mike/Xenodex/fulfillment/data/simple_output.csv")
-        elif text_mode:
-            output_file = "/home/Mike/Xenodex/fulfillment/data/text_extraction_output.csv"
-        else:
-            output_file = config.get("paths.output_csv", "/home/Mike/Xenodex/fulfillment/data/simple_output.csv")
+    for record in records:
+        for col in required_columns:
+            record.setdefault(col, '')
+        filtered_records.append({col: record[col] for col in required_columns})
+    return filtered_records
+
+
+def step6_map_data(processed_records, basic_mode=False, text_mode=False, output_file=None):
+    """Step 6: Map data to CSV"""
+    print("Step 6: Mapping data to CSV...")
+    
+    required_columns, default_output_file = get_mode_output_settings(basic_mode, text_mode)
+    output_file = output_file or default_output_file
     
     # Create DataFrame for CSV operations
-    df = pd.DataFrame(filtered_records)
+    df = pd.DataFrame(fill_and_filter_records(processed_records, required_columns))
     
     # Write to CSV
     print("  📄 Writing to CSV...")
@@ -635,19 +676,22 @@ def step6_map_data(processed_records, basic_mode=False, text_mode=False, output_
         print(f"  ❌ Failed to save data to {output_file}")
         return None
     
+    # Counts come straight from boolean masks - no filtered DataFrame copies
     print(f"  📊 Total records: {len(df)}")
-    print(f"  📊 Records with links: {len(df[df[CSVConstants.Columns.LINK] != ''])}")
+    print(f"  📊 Records with links: {int((df[CSVConstants.Columns.LINK] != '').sum())}")
     
     # Additional stats only for full mode
     if not basic_mode and not text_mode:
-        print(f"  📊 Records with YouTube: {len(df[df[CSVConstants.Columns.YOUTUBE_PLAYLIST] != ''])}")
-        print(f"  📊 Records with Drive: {len(df[df[CSVConstants.Columns.GOOGLE_DRIVE] != ''])}")
+        print(f"  📊 Records with YouTube: {int((df[CSVConstants.Columns.YOUTUBE_PLAYLIST] != '').sum())}")
+        print(f"  📊 Records with Drive: {int((df[CSVConstants.Columns.GOOGLE_DRIVE] != '').sum())}")
     
     # Text mode specific stats
     if text_mode:
         if 'document_text' in df.columns:
-            successful_extractions = len(df[(df[CSVConstants.Columns.DOCUMENT_TEXT] != '') & (~df[CSVConstants.Columns.DOCUMENT_TEXT].str.startswith('EXTRACTION_FAILED', na=False))])
-            failed_extractions = len(df[df[CSVConstants.Columns.DOCUMENT_TEXT].str.startswith('EXTRACTION_FAILED', na=False)])
+            document_text = df[CSVConstants.Columns.DOCUMENT_TEXT]
+            failed_mask = document_text.str.startswith('EXTRACTION_FAILED', na=False)
+            successful_extractions = int(((document_text != '') & ~failed_mask).sum())
+            failed_extractions = int(failed_mask.sum())
             print(f"  📊 Successful text extractions: {successful_extractions}")
             print(f"  📊 Failed text extractions: {failed_extractions}")
     
@@ -659,37 +703,11 @@ def update_csv_incrementally(all_records, current_index, record, basic_mode=Fals
     # Update the record at the current index
     all_records[current_index] = record
     
-    # Handle different column sets based on processing mode
-    if basic_mode:
-        required_columns = config.get('csv_columns.basic')
-    elif text_mode:
-        required_columns = config.get('csv_columns.text')
-    else:
-        required_columns = config.get('csv_columns.full')
-    
-    # Ensure all required columns are present in all records
-    for rec in all_records:
-        for col in required_columns:
-            if col not in rec:
-                rec[col] = ''
-    
-    # Filter records to only include required columns in correct order
-    filtered_records = []
-    for rec in all_records:
-        filtered_record = {col: rec.get(col, '') for col in required_columns}
-        filtered_records.append(filtered_record)
-    
-    # Determine output file
-    if not output_file:
-        if basic_mode:
-            output_file = config.get("paths.output_csv", "/home/Mike/Xenodex/fulfillment/data/simple_output.csv")
-        elif text_mode:
-            output_file = "/home/Mike/Xenodex/fulfillment/data/text_extraction_output.csv"
-        else:
-            output_file = config.get("paths.output_csv", "/home/Mike/Xenodex/fulfillment/data/simple_output.csv")
+    required_columns, default_output_file = get_mode_output_settings(basic_mode, text_mode)
+    output_file = output_file or default_output_file
     
     # Create DataFrame for CSV operations
-    df = pd.DataFrame(filtered_records)
+    df = pd.DataFrame(fill_and_filter_records(all_records, required_columns))
     
     # Write to CSV
     csv_manager = CSVManager(csv_path=output_file)
@@ -767,12 +785,10 @@ def main():
     # Create a lookup for people with docs for efficient processing
     people_with_docs_dict = {person['row_id']: person for person in people_with_docs}
     
-    # Pre-initialize all records with basic data for incremental updates
-    all_records = []
-    for person in all_people:
-        # Create basic record for each person
-        basic_record = CSVManager.create_record(person, mode='basic')
-        all_records.append(basic_record)
+    # Pre-initialize all records for incremental updates, directly in the
+    # format the run needs (text mode used to build basic records then replace them)
+    initial_mode = 'text' if text_mode and not basic_mode else 'basic'
+    all_records = [CSVManager.create_record(person, mode=initial_mode) for person in all_people]
     
     # Determine processing approach based on mode
     if basic_mode:
@@ -796,22 +812,18 @@ def main():
         progress = load_json_state(config.get("paths.extraction_progress", "extraction_progress.json"), default_progress) if args.resume else default_progress
         failed_docs = load_failed_docs() if args.retry_failed else []
         
-        # Update all_records to text mode format
-        for i, person in enumerate(all_people):
-            # Update basic record to text mode record
-            text_record = CSVManager.create_record(person, mode='text')
-            all_records[i] = text_record
-        
         # Write initial CSV with all records in text mode format
         print("\n📝 Writing initial CSV with text mode columns...")
         update_csv_incrementally(all_records, 0, all_records[0], basic_mode=basic_mode, text_mode=text_mode, output_file=output_file)
         
         # Determine which documents to process
         if args.retry_failed and failed_docs:
-            docs_to_process = [person for person in people_with_docs if person['doc_link'] in failed_docs]
+            failed_doc_set = set(failed_docs)
+            docs_to_process = [person for person in people_with_docs if person['doc_link'] in failed_doc_set]
             print(f"  Retrying {len(docs_to_process)} previously failed documents...")
         elif args.resume:
-            docs_to_process = [person for person in people_with_docs if person['doc_link'] not in progress['completed']]
+            completed_docs = set(progress['completed'])
+            docs_to_process = [person for person in people_with_docs if person['doc_link'] not in completed_docs]
             print(f"  Resuming: {len(docs_to_process)} remaining documents...")
         else:
             docs_to_process = people_with_docs
@@ -1,46 +1,71 @@
 #!/usr/bin/env python3
 """Test script to verify all paths are correctly configured"""
 
+import argparse
+import contextlib
+import importlib
+import json
 import os
 import sys
+import time
 from pathlib import Path
 
 # Add original project directory to path
-sys.path.insert(0, '/home/Mike/projects/xenodx/typing-clients-ingestion-minimal')
+UTILS_ROOT = '/home/Mike/projects/xenodx/typing-clients-ingestion-minimal'
+if UTILS_ROOT not in sys.path:
+    sys.path.insert(0, UTILS_ROOT)
+
+# Shared fixtures, built once for the whole run
+PROJECT_ROOT = Path(__file__).resolve().parent
+DATA_ROOT = PROJECT_ROOT / "data"
+DATA_PATHS = (
+    DATA_ROOT,
+    DATA_ROOT / "drive_downloads",
+    DATA_ROOT / "youtube_downloads",
+    DATA_ROOT / "simple_downloads",
+    DATA_ROOT / "downloads",
+)
+IMPORT_CASES = (
+    ("utils.config", "get_config"),
+    ("utils.validation", "validate_youtube_url"),
+    ("utils.csv_manager", "CSVManager"),
+)
+CONFIG_PATH = PROJECT_ROOT / "process_data" / "config" / "config.yaml"
+PROCESSORS_DIR = str(PROJECT_ROOT / "process_data" / "processors")
+
+def _import_data_processing():
+    """Import data_processing, or return None when the out-of-tree utils package is missing"""
+    if PROCESSORS_DIR not in sys.path:
+        sys.path.insert(0, PROCESSORS_DIR)
+    try:
+        return importlib.import_module("data_processing")
+    except ImportError as e:
+        if (e.name or "").split(".")[0] == "utils":
+            return None
+        raise
 
 def test_imports():
     """Test that all imports work correctly"""
     print("Testing imports...")
-    try:
-        from utils.config import get_config
-        print("✓ utils.config imported successfully")
-        
-        from utils.validation import validate_youtube_url
-        print("✓ utils.validation imported successfully")
-        
-        from utils.csv_manager import CSVManager
-        print("✓ utils.csv_manager imported successfully")
-        
-        return True
-    except ImportError as e:
-        print(f"✗ Import error: {e}")
-        return False
+    # Each case is checked independently so one failure doesn't hide the others
+    all_good = True
+    for module_name, attr in IMPORT_CASES:
+        try:
+            getattr(importlib.import_module(module_name), attr)
+            print(f"✓ {module_name} imported successfully")
+        except (ImportError, AttributeError) as e:
+            print(f"✗ Import error in {module_name}: {e}")
+            all_good = False
+    
+    return all_good
 
 def test_paths():
     """Test that all data paths exist or can be created"""
     print("\nTesting data paths...")
     
-    data_paths = [
-        "/home/Mike/Xenodx/fulfillment/data",
-        "/home/Mike/Xenodx/fulfillment/data/drive_downloads",
-        "/home/Mike/Xenodx/fulfillment/data/youtube_downloads",
-        "/home/Mike/Xenodx/fulfillment/data/simple_downloads",
-        "/home/Mike/Xenodx/fulfillment/data/downloads"
-    ]
-    
     all_good = True
-    for path in data_paths:
-        p = Path(path)
+    for p in DATA_PATHS:
+        path = str(p)
         if p.exists():
             print(f"✓ {path} exists")
         else:
@@ -59,7 +84,7 @@ def test_config():
     
     try:
         # First check if config file exists in new location
-        config_path = Path("/home/Mike/Xenodx/fulfillment/process_data/config/config.yaml")
+        config_path = CONFIG_PATH
         if config_path.exists():
             print(f"✓ Config file exists at {config_path}")
         else:
@@ -82,18 +107,96 @@ def test_config():
         print(f"✗ Config error: {e}")
         return False
 
+def test_email_normalization():
+    """Test email normalization, including an all-blank column"""
+    print("\nTesting email normalization...")
+    
+    data_processing = _import_data_processing()
+    if data_processing is None:
+        print("- Skipped: utils package not available")
+        return True
+    
+    import pandas as pd
+    all_good = True
+    cases = (
+        ("mixed", ["  A@Example.com ", "not-an-email", ""], ["a@example.com", None, None]),
+        ("all blank", ["", "   ", None], [None, None, None]),
+    )
+    for label, values, expected in cases:
+        result = data_processing.normalize_email_column(pd.Series(values))
+        actual = [None if pd.isna(v) else v for v in result]
+        if actual == expected:
+            print(f"✓ {label} column normalized")
+        else:
+            print(f"✗ {label} column: expected {expected}, got {actual}")
+            all_good = False
+    
+    return all_good
+
+def test_summary_stats():
+    """Test summary stats on numeric and bool columns"""
+    print("\nTesting summary stats...")
+    
+    data_processing = _import_data_processing()
+    if data_processing is None:
+        print("- Skipped: utils package not available")
+        return True
+    
+    import pandas as pd
+    df = pd.DataFrame({"count": [1, 2, 3, 4], "flag": [True, True, False, True]})
+    try:
+        columns = data_processing.generate_summary_stats(df)["columns"]
+    except Exception as e:
+        print(f"✗ generate_summary_stats raised: {e}")
+        return False
+    
+    if columns["flag"]["median"] == 1.0 and columns["count"]["median"] == 2.5:
+        print("✓ numeric and bool columns summarized")
+        return True
+    print(f"✗ unexpected medians: {columns['count']['median']}, {columns['flag']['median']}")
+    return False
+
+TEST_CASES = (
+    ("Imports", test_imports),
+    ("Data Paths", test_paths),
+    ("Configuration", test_config),
+    ("Email Normalization", test_email_normalization),
+    ("Summary Stats", test_summary_stats),
+)
+
+def run_cases():
+    """Run every case (even if an earlier one blows up); returns [(name, passed, elapsed_ms)]"""
+    results = []
+    for test_name, test_func in TEST_CASES:
+        start = time.perf_counter_ns()
+        try:
+            passed = test_func()
+        except Exception as e:
+            print(f"✗ {test_name} raised: {e}")
+            passed = False
+        results.append((test_name, passed, (time.perf_counter_ns() - start) / 1e6))
+    return results
+
 def main():
     """Run all tests"""
-    print("=== Path Configuration Test ===\n")
+    parser = argparse.ArgumentParser(description='Verify path configuration')
+    parser.add_argument('--json', action='store_true',
+                        help='Emit one JSON record per check on stdout (progress goes to stderr)')
+    args = parser.parse_args()
     
-    results = []
-    results.append(("Imports", test_imports()))
-    results.append(("Data Paths", test_paths()))
-    results.append(("Configuration", test_config()))
+    if args.json:
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run_cases()
+        for test_name, passed, elapsed_ms in results:
+            print(json.dumps({"check": test_name, "passed": passed, "elapsed_ms": round(elapsed_ms, 3)}))
+        return 0 if all(passed for _, passed, _ in results) else 1
+    
+    print("=== Path Configuration Test ===\n")
+    results = run_cases()
     
     print("\n=== Test Summary ===")
     all_passed = True
-    for test_name, passed in results:
+    for test_name, passed, _ in results:
         status = "PASSED" if passed else "FAILED"
         print(f"{test_name}: {status}")
         if not passed: